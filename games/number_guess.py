@@ -5,7 +5,8 @@ Demonstrates: random numbers, loops, conditionals, user input, game statistics
 
 import random
 import time
-from utils.helpers import clear_screen, print_colored, validate_input, animate_text
+from utils.helpers import clear_screen, print_colored, validate_input, animate_text, format_time
+from utils.telemetry import record, new_session_id
 from colorama import Fore, Style
 
 class NumberGuessingGame:
@@ -91,6 +92,9 @@ class NumberGuessingGame:
         secret_number = random.randint(min_num, max_num)
         attempts = 0
         used_hints = 0
+        session = new_session_id()
+        start_time = time.time()
+        record('number_guess', 'round_start', session, difficulty=difficulty)
         
         clear_screen()
         print_colored(f"🎲 {difficulty.title()} Mode - Number Guessing Game", Fore.CYAN)
@@ -113,6 +117,9 @@ class NumberGuessingGame:
                 int
             )
             
+            record('number_guess', 'guess', session, attempt=attempts,
+                   guess=guess, correct=guess == secret_number)
+            
             # Check if correct
             if guess == secret_number:
                 print_colored("🎉 Congratulations! You guessed it right! 🎉", Fore.GREEN)
@@ -126,6 +133,7 @@ class NumberGuessingGame:
                 if attempts < self.stats['best_score']:
                     self.stats['best_score'] = attempts
                 
+                self.record_round_end(session, start_time, difficulty, True, attempts, used_hints)
                 return True
             
             # Provide hint if available
@@ -140,6 +148,7 @@ class NumberGuessingGame:
                     used_hints += 1
                     hint = self.get_hint(secret_number, guess, min_num, max_num, used_hints)
                     print_colored(f"💡 Hint: {hint}", Fore.MAGENTA)
+                    record('number_guess', 'hint', session, attempt=attempts)
             
             # Show remaining attempts
             if remaining_attempts > 1:
@@ -154,8 +163,16 @@ class NumberGuessingGame:
         self.stats['games_played'] += 1
         self.stats['total_attempts'] += attempts
         
+        self.record_round_end(session, start_time, difficulty, False, attempts, used_hints)
         return False
     
+    def record_round_end(self, session, start_time, difficulty, won, attempts, used_hints):
+        """Log how a round finished"""
+        elapsed_time = time.time() - start_time
+        record('number_guess', 'round_end', session, difficulty=difficulty, won=won,
+               attempts=attempts, hints=used_hints,
+               duration=format_time(elapsed_time), duration_seconds=elapsed_time)
+    
     def show_statistics(self):
         """Display player statistics"""
         if self.stats['games_played'] == 0:
@@ -0,0 +1,143 @@
+"""
+⏱️ Search Benchmark - Make/unmake moves versus copying the game state
+Demonstrates: game tree search, undo stacks, simple benchmarking
+"""
+
+import copy
+import random
+import time
+
+from games.snake_game import SnakeGame
+from games.snake_levels import DIRECTIONS
+from games.tic_tac_toe import TicTacToe
+
+
+# ---------------------------------------------------------------------------
+# Tic-Tac-Toe: full minimax (X maximizes, O minimizes)
+# ---------------------------------------------------------------------------
+
+def free_cells(game):
+    """Empty cells on a tic-tac-toe board"""
+    return [(r, c) for r in range(3) for c in range(3) if game.board[r][c] == ' ']
+
+
+def outcome(game):
+    """Score a finished tic-tac-toe game from X's point of view"""
+    if game.winner == 'X':
+        return 1
+    if game.winner == 'O':
+        return -1
+    return 0
+
+
+def minimax_unmake(game, counter):
+    """Minimax that makes and unmakes moves on a single board"""
+    counter[0] += 1
+    if game.game_over:
+        return outcome(game)
+
+    pick = max if game.current_player == 'X' else min
+    scores = []
+    for row, col in free_cells(game):
+        game.make_move(row, col)
+        scores.append(minimax_unmake(game, counter))
+        game.unmake_move()
+    return pick(scores)
+
+
+def minimax_copy(game, counter):
+    """Minimax that deep-copies the board for every child node"""
+    counter[0] += 1
+    if game.game_over:
+        return outcome(game)
+
+    pick = max if game.current_player == 'X' else min
+    scores = []
+    for row, col in free_cells(game):
+        child = copy.copy(game)
+        child.board = copy.deepcopy(game.board)
+        child.undo_stack = []
+        child.make_move(row, col)
+        scores.append(minimax_copy(child, counter))
+    return pick(scores)
+
+
+# ---------------------------------------------------------------------------
+# Snake: depth-limited search for the highest reachable score
+# ---------------------------------------------------------------------------
+
+def snake_search_undo(game, depth, counter):
+    """Depth-limited search using step() and undo_step()"""
+    counter[0] += 1
+    if depth == 0 or game.game_over:
+        return game.score
+
+    best = -1
+    for direction in DIRECTIONS:
+        game.step(direction)
+        best = max(best, snake_search_undo(game, depth - 1, counter))
+        game.undo_step()
+    return best
+
+
+def snake_search_copy(game, depth, counter):
+    """Depth-limited search that copies the snake for every child node"""
+    counter[0] += 1
+    if depth == 0 or game.game_over:
+        return game.score
+
+    best = -1
+    for direction in DIRECTIONS:
+        child = copy.copy(game)
+        child.snake = copy.deepcopy(game.snake)
+        child.occupied = bytearray(game.occupied)
+        child.undo_stack = type(game.undo_stack)(maxlen=1)
+        child.step(direction)
+        best = max(best, snake_search_copy(child, depth - 1, counter))
+    return best
+
+
+# ---------------------------------------------------------------------------
+# Runner
+# ---------------------------------------------------------------------------
+
+def time_search(search, make_game, repeat):
+    """Run a search repeat times and return (nodes, seconds)"""
+    counter = [0]
+    start_time = time.perf_counter()
+    for _ in range(repeat):
+        search(make_game(), counter)
+    return counter[0], time.perf_counter() - start_time
+
+
+def run_benchmark(repeat=3, snake_depth=6, seed=0):
+    """Compare nodes/sec of undo-based and copy-based search for both games
+
+    Returns a list of result dictionaries, one per game and method.
+    """
+    def opening_position():
+        game = TicTacToe()
+        game.make_move(1, 1)  # Searching from one move in keeps runs short
+        return game
+
+    def snake_position():
+        return SnakeGame(headless=True, rng=random.Random(seed))
+
+    cases = [
+        ('tic_tac_toe', 'make/unmake', minimax_unmake, opening_position),
+        ('tic_tac_toe', 'copy', minimax_copy, opening_position),
+        ('snake', 'step/undo', lambda g, c: snake_search_undo(g, snake_depth, c), snake_position),
+        ('snake', 'copy', lambda g, c: snake_search_copy(g, snake_depth, c), snake_position),
+    ]
+
+    results = []
+    for game_name, method, search, make_game in cases:
+        nodes, elapsed = time_search(search, make_game, repeat)
+        results.append({
+            'game': game_name,
+            'method': method,
+            'nodes': nodes,
+            'seconds': elapsed,
+            'nodes_per_sec': nodes / elapsed if elapsed > 0 else 0.0,
+        })
+    return results
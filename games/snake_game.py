@@ -3,23 +3,41 @@
 Demonstrates: pygame, game loops, collision detection, event handling
 """
 
+import math
 import pygame
 import random
 import sys
+from collections import deque
+from itertools import islice
 from utils.colors import GameColors
 from utils.helpers import clear_screen, print_colored, format_time
+from utils.assets import AssetManager, SNAKE_TILES, SNAKE_SOUNDS, get_font
+from utils.runtime import get_runtime
+from utils.telemetry import record, new_session_id
+from games.snake_levels import load_level, DIRECTION_INDEX, WALL, PORTAL
 
 class SnakeGame:
-    def __init__(self):
-        # Initialize pygame
-        pygame.init()
+    def __init__(self, headless=False, rng=None, level='classic'):
+        # Headless games skip the window and fonts so bots can play them
+        self.headless = headless
+        self.rng = rng if rng is not None else random
         
-        # Game constants
-        self.WINDOW_WIDTH = 800
-        self.WINDOW_HEIGHT = 600
+        # Game constants (grid and window size come from the level)
         self.GRID_SIZE = 20
-        self.GRID_WIDTH = self.WINDOW_WIDTH // self.GRID_SIZE
-        self.GRID_HEIGHT = self.WINDOW_HEIGHT // self.GRID_SIZE
+        self.load_level(level)
+        self.TICK_MS = 100         # The snake moves once per tick
+        self.INPUT_FPS = 60        # Keys are polled (and frames drawn) this often
+        self.INPUT_QUEUE_SIZE = 3  # Turns remembered between ticks
+        self.UNDO_LIMIT = 600      # Ticks of history kept for undo (one minute)
+        self.REWIND_TICKS = 10     # Ticks undone by one press of BACKSPACE
+        
+        # Arrow keys and the direction they turn the snake
+        self.KEY_DIRECTIONS = {
+            pygame.K_UP: (0, -1),
+            pygame.K_DOWN: (0, 1),
+            pygame.K_LEFT: (-1, 0),
+            pygame.K_RIGHT: (1, 0),
+        }
         
         # Colors
         self.BLACK = GameColors.BACKGROUND
@@ -28,38 +46,96 @@ class SnakeGame:
         self.RED = GameColors.FOOD
         self.WHITE = GameColors.TEXT
         
-        # Game state
-        self.clock = pygame.time.Clock()
-        self.screen = pygame.display.set_mode((self.WINDOW_WIDTH, self.WINDOW_HEIGHT))
-        pygame.display.set_caption("🐍 Snake Game - Python Games Collection")
+        # Milliseconds from key press to the turn being applied
+        self.input_latencies = deque(maxlen=1000)
         
-        # Font for score display
-        self.font = pygame.font.Font(None, 36)
-        self.small_font = pygame.font.Font(None, 24)
+        if not headless:
+            self.init_display()
         
         self.reset_game()
     
+    def init_display(self):
+        """Attach to the shared pygame runtime, window, fonts and assets"""
+        self.runtime = get_runtime()
+        self.runtime.start()  # The asset loader needs the mixer running
+        
+        # Read sprites and sounds in the background while the window opens
+        # (only the first game in the process actually loads anything)
+        self.assets = self.runtime.get_shared(('snake', self.GRID_SIZE), self.start_loading_assets)
+        
+        self.show_window()
+        self.clock = self.runtime.clock
+        
+        # Font for score display
+        self.font = get_font(None, 36)
+        self.small_font = get_font(None, 24)
+        
+        # Converting needs the window, so the atlas is built last
+        self.assets.finish_loading()
+    
+    def start_loading_assets(self):
+        """Create the asset manager and start its background loader"""
+        assets = AssetManager('snake', SNAKE_TILES, SNAKE_SOUNDS, tile_size=self.GRID_SIZE)
+        assets.start_loading()
+        return assets
+    
+    def show_window(self):
+        """Show the shared window sized for this game"""
+        self.screen = self.runtime.show((self.WINDOW_WIDTH, self.WINDOW_HEIGHT),
+                                        "🐍 Snake Game - Python Games Collection")
+    
+    def load_level(self, name):
+        """Switch to a level from assets/snake/levels"""
+        self.level = load_level(name)
+        self.GRID_WIDTH = self.level.width
+        self.GRID_HEIGHT = self.level.height
+        self.WINDOW_WIDTH = self.GRID_WIDTH * self.GRID_SIZE
+        self.WINDOW_HEIGHT = self.GRID_HEIGHT * self.GRID_SIZE
+        self.level_background = None  # Drawn again on the next frame
+    
     def reset_game(self):
         """Reset the game to initial state"""
-        # Snake starts in the center, moving right
-        center_x = self.GRID_WIDTH // 2
-        center_y = self.GRID_HEIGHT // 2
-        self.snake = [(center_x, center_y), (center_x - 1, center_y), (center_x - 2, center_y)]
+        # Snake starts at the level's start cell, moving right
+        start_x, start_y = self.level.start
+        self.snake = deque(((start_x - i) % self.GRID_WIDTH, start_y) for i in range(3))
+        
+        # One flag per cell so self collision is a single lookup
+        self.occupied = bytearray(self.GRID_WIDTH * self.GRID_HEIGHT)
+        for segment in self.snake:
+            self.occupied[self.level.cell_index(segment)] = 1
+        
         self.direction = (1, 0)  # Moving right
+        self.input_queue = deque()  # (direction, pressed_at_ms) waiting for a tick
+        self.undo_stack = deque(maxlen=self.UNDO_LIMIT)
         self.score = 0
         self.game_over = False
+        self.won = False  # The snake filled every free cell
         self.paused = False
         self.start_time = pygame.time.get_ticks()
         self.spawn_food()
+        
+        self.session = new_session_id()
+        if not self.headless:
+            record('snake', 'game_start', self.session, level=self.level.name)
     
     def spawn_food(self):
-        """Spawn food at a random location"""
-        while True:
-            x = random.randint(0, self.GRID_WIDTH - 1)
-            y = random.randint(0, self.GRID_HEIGHT - 1)
-            if (x, y) not in self.snake:
-                self.food = (x, y)
-                break
+        """Spawn food at a random free cell; returns False if none are left"""
+        free_cells = self.level.free_cells
+        
+        # Random picks find a cell quickly while most of the board is open
+        for _ in range(32):
+            cell = free_cells[self.rng.randrange(len(free_cells))]
+            if not self.occupied[cell]:
+                self.food = self.level.position(cell)
+                return True
+        
+        # The snake covers most of the board - choose among the cells left
+        open_cells = [cell for cell in free_cells if not self.occupied[cell]]
+        if not open_cells:
+            self.food = None
+            return False
+        self.food = self.level.position(self.rng.choice(open_cells))
+        return True
     
     def handle_events(self):
         """Handle pygame events"""
@@ -73,67 +149,180 @@ class SnakeGame:
                     self.paused = not self.paused
                 elif event.key == pygame.K_r and self.game_over:
                     self.reset_game()
+                elif event.key == pygame.K_BACKSPACE and (self.game_over or self.paused):
+                    self.rewind(self.REWIND_TICKS)
                 elif not self.game_over and not self.paused:
-                    # Direction controls
-                    if event.key == pygame.K_UP and self.direction != (0, 1):
-                        self.direction = (0, -1)
-                    elif event.key == pygame.K_DOWN and self.direction != (0, -1):
-                        self.direction = (0, 1)
-                    elif event.key == pygame.K_LEFT and self.direction != (1, 0):
-                        self.direction = (-1, 0)
-                    elif event.key == pygame.K_RIGHT and self.direction != (-1, 0):
-                        self.direction = (1, 0)
+                    # Direction controls are queued and applied one per tick
+                    if event.key in self.KEY_DIRECTIONS:
+                        self.queue_turn(self.KEY_DIRECTIONS[event.key])
         return True
     
+    def queue_turn(self, direction):
+        """Remember a turn so quick key sequences are not lost
+        
+        The press time is taken when the event is polled. run() polls every
+        1/INPUT_FPS seconds, so it is within one input frame of the real press.
+        """
+        if self.input_queue and self.input_queue[-1][0] == direction:
+            return  # Repeated key presses only need one slot
+        if len(self.input_queue) < self.INPUT_QUEUE_SIZE:
+            self.input_queue.append((direction, pygame.time.get_ticks()))
+    
+    def apply_queued_turn(self):
+        """Apply the first valid queued turn; later turns wait for the next tick"""
+        while self.input_queue:
+            direction, pressed_at = self.input_queue.popleft()
+            
+            # Skip turns that do nothing or would reverse into the body
+            if direction == self.direction:
+                continue
+            if direction == (-self.direction[0], -self.direction[1]):
+                continue
+            
+            self.direction = direction
+            latency = pygame.time.get_ticks() - pressed_at
+            self.input_latencies.append(latency)
+            if not self.headless:
+                record('snake', 'turn', self.session, latency_ms=latency)
+            return
+    
+    def latency_report(self):
+        """Summarize key-to-move latency in milliseconds"""
+        if not self.input_latencies:
+            return None
+        samples = sorted(self.input_latencies)
+        return {
+            'turns': len(samples),
+            'average': sum(samples) / len(samples),
+            'p95': samples[math.ceil(0.95 * len(samples)) - 1],  # Nearest rank
+            'max': samples[-1],
+        }
+    
     def update_game(self):
         """Update game logic"""
         if self.game_over or self.paused:
             return
         
-        # Move snake
-        head_x, head_y = self.snake[0]
-        new_head = (head_x + self.direction[0], head_y + self.direction[1])
+        self.apply_queued_turn()
         
-        # Check wall collision
-        if (new_head[0] < 0 or new_head[0] >= self.GRID_WIDTH or
-            new_head[1] < 0 or new_head[1] >= self.GRID_HEIGHT):
-            self.game_over = True
+        result = self.step(self.direction)
+        if result == 'crash':
+            self.play_sound('game_over')
+            self.record_game_over()
+        elif result == 'win':
+            self.play_sound('eat')
+            self.record_game_over()
+        elif result == 'eat':
+            self.play_sound('eat')
+            if not self.headless:
+                record('snake', 'food_eaten', self.session, score=self.score)
+    
+    def record_game_over(self):
+        """Log the end of a game with its score and duration"""
+        if self.headless:
             return
+        elapsed_time = (pygame.time.get_ticks() - self.start_time) / 1000
+        record('snake', 'game_over', self.session, score=self.score, length=len(self.snake),
+               won=self.won, duration=format_time(elapsed_time), duration_seconds=elapsed_time)
+    
+    def step(self, direction):
+        """Move one tick in direction and record how to undo it
+        
+        Returns 'crash', 'eat', 'win' (the snake ate and now fills every
+        free cell) or 'move'. Each step pushes a small undo
+        record, so undo_step() restores the state without copying the snake.
+        """
+        previous = (self.direction, self.food, self.score)
+        self.direction = direction
         
-        # Check self collision
-        if new_head in self.snake:
+        # Move snake - walls, edges, wrap-around and portals are all
+        # precomputed in the level's next-cell table
+        head_cell = self.level.cell_index(self.snake[0])
+        new_cell = self.level.next_cell[head_cell * 4 + DIRECTION_INDEX[direction]]
+        
+        # Check wall and self collision
+        if new_cell < 0 or self.occupied[new_cell]:
             self.game_over = True
-            return
+            self.undo_stack.append((None, None) + previous)
+            return 'crash'
         
         # Add new head
-        self.snake.insert(0, new_head)
+        new_head = self.level.position(new_cell)
+        self.snake.appendleft(new_head)
+        self.occupied[new_cell] = 1
         
         # Check food collision
         if new_head == self.food:
             self.score += 10
-            self.spawn_food()
-        else:
-            # Remove tail if no food eaten
-            self.snake.pop()
+            self.undo_stack.append((new_cell, None) + previous)
+            if not self.spawn_food():
+                self.game_over = True
+                self.won = True
+                return 'win'
+            return 'eat'
+        
+        # Remove tail if no food eaten
+        tail = self.snake.pop()
+        self.occupied[self.level.cell_index(tail)] = 0
+        self.undo_stack.append((new_cell, tail) + previous)
+        return 'move'
+    
+    def undo_step(self):
+        """Undo the most recent step()"""
+        new_cell, tail, self.direction, self.food, self.score = self.undo_stack.pop()
+        self.game_over = False
+        self.won = False
+        if new_cell is None:
+            return  # The step crashed, so the snake never moved
+        
+        self.snake.popleft()
+        self.occupied[new_cell] = 0
+        if tail is not None:
+            self.snake.append(tail)
+            self.occupied[self.level.cell_index(tail)] = 1
+    
+    def rewind(self, ticks):
+        """Let the player take back the last few ticks"""
+        for _ in range(min(ticks, len(self.undo_stack))):
+            self.undo_step()
+        self.input_queue.clear()
+        self.paused = True  # Resume with SPACE when ready
+        if not self.headless:
+            record('snake', 'rewind', self.session, ticks=ticks)
+    
+    def neighbour(self, position, direction):
+        """Where the head would go from position, or None if that is a wall"""
+        cell = self.level.next_cell[self.level.cell_index(position) * 4 + DIRECTION_INDEX[direction]]
+        return None if cell < 0 else self.level.position(cell)
+    
+    def play_sound(self, name):
+        """Play a sound effect (headless games stay silent)"""
+        if not self.headless:
+            self.assets.play_sound(name)
+    
+    def draw_level_background(self):
+        """Draw the level's walls and portals once onto a reusable surface"""
+        size = self.GRID_SIZE
+        background = pygame.Surface((self.WINDOW_WIDTH, self.WINDOW_HEIGHT)).convert()
+        background.fill(self.BLACK)
+        tiles = [('wall', (x * size, y * size)) for x, y in self.level.cells_of_type(WALL)]
+        tiles += [('portal', (x * size, y * size)) for x, y in self.level.cells_of_type(PORTAL)]
+        self.assets.draw_tiles(background, tiles)
+        return background
     
     def draw_game(self):
         """Draw the game"""
-        self.screen.fill(self.BLACK)
-        
-        # Draw snake
-        for i, segment in enumerate(self.snake):
-            x = segment[0] * self.GRID_SIZE
-            y = segment[1] * self.GRID_SIZE
-            color = self.GREEN if i == 0 else self.DARK_GREEN
-            pygame.draw.rect(self.screen, color, (x, y, self.GRID_SIZE, self.GRID_SIZE))
-            
-            # Add border to snake segments
-            pygame.draw.rect(self.screen, self.WHITE, (x, y, self.GRID_SIZE, self.GRID_SIZE), 1)
+        if self.level_background is None:
+            self.level_background = self.draw_level_background()
+        self.screen.blit(self.level_background, (0, 0))
         
-        # Draw food
-        food_x = self.food[0] * self.GRID_SIZE
-        food_y = self.food[1] * self.GRID_SIZE
-        pygame.draw.rect(self.screen, self.RED, (food_x, food_y, self.GRID_SIZE, self.GRID_SIZE))
+        # Draw snake and food from the atlas in one batch
+        size = self.GRID_SIZE
+        tiles = [('body', (x * size, y * size)) for x, y in islice(self.snake, 1, None)]
+        tiles.append(('head', (self.snake[0][0] * size, self.snake[0][1] * size)))
+        if self.food is not None:
+            tiles.append(('food', (self.food[0] * size, self.food[1] * size)))
+        self.assets.draw_tiles(self.screen, tiles)
         
         # Draw score
         score_text = self.font.render(f"Score: {self.score}", True, self.WHITE)
@@ -149,11 +338,12 @@ class SnakeGame:
             instructions = [
                 "Use arrow keys to move",
                 "SPACE: Pause/Resume",
+                "BACKSPACE (paused): Rewind",
                 "ESC: Quit"
             ]
             for i, instruction in enumerate(instructions):
                 text = self.small_font.render(instruction, True, self.WHITE)
-                self.screen.blit(text, (10, self.WINDOW_HEIGHT - 80 + i * 20))
+                self.screen.blit(text, (10, self.WINDOW_HEIGHT - 100 + i * 20))
         
         # Draw pause message
         if self.paused:
@@ -163,9 +353,10 @@ class SnakeGame:
         
         # Draw game over message
         if self.game_over:
-            game_over_text = self.font.render("GAME OVER!", True, self.RED)
+            message = "YOU WIN!" if self.won else "GAME OVER!"
+            game_over_text = self.font.render(message, True, self.GREEN if self.won else self.RED)
             final_score_text = self.font.render(f"Final Score: {self.score}", True, self.WHITE)
-            restart_text = self.small_font.render("Press R to restart or ESC to quit", True, self.WHITE)
+            restart_text = self.small_font.render("Press R to restart, BACKSPACE to rewind or ESC to quit", True, self.WHITE)
             
             # Center the text
             game_over_rect = game_over_text.get_rect(center=(self.WINDOW_WIDTH // 2, self.WINDOW_HEIGHT // 2 - 40))
@@ -183,12 +374,33 @@ class SnakeGame:
         print_colored("🐍 Starting Snake Game...", "green")
         print_colored("Use arrow keys to move, SPACE to pause, ESC to quit", "yellow")
         
+        self.show_window()
+        
+        # The game object outlives a session, but the latency report should not
+        self.input_latencies.clear()
+        
+        # Poll keys much faster than the snake moves so a press is timestamped
+        # close to when it happened, and step the game on its own timer
+        next_step = pygame.time.get_ticks() + self.TICK_MS
         running = True
         while running:
             running = self.handle_events()
-            self.update_game()
+            
+            now = pygame.time.get_ticks()
+            if now >= next_step:
+                self.update_game()
+                # Don't try to catch up after a stall, just keep the pace
+                next_step = max(next_step + self.TICK_MS, now + 1)
+            
             self.draw_game()
-            self.clock.tick(10)  # 10 FPS for smooth gameplay
+            self.clock.tick(self.INPUT_FPS)
+        
+        # Keep pygame alive so the next game from the menu starts instantly
+        self.runtime.hide()
         
-        pygame.quit()
+        latency = self.latency_report()
+        if latency:
+            print_colored(f"⌨️ Input latency over {latency['turns']} turns: "
+                          f"avg {latency['average']:.0f} ms, p95 {latency['p95']} ms, "
+                          f"max {latency['max']} ms", "cyan")
         print_colored("🐍 Snake Game ended. Thanks for playing!", "cyan")
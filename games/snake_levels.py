@@ -0,0 +1,260 @@
+"""
+🧱 Snake Levels - Text maps compiled into cached collision grids
+Demonstrates: file formats, hashing, binary caches, memory mapping
+
+Levels live in assets/snake/levels/<name>.txt:
+
+    ; comment lines start with a semicolon
+    @wrap            optional - leaving one edge enters from the other
+    ########
+    #..S...#         '#' wall, '.' floor, 'S' snake start (faces right,
+                     needs two floor cells behind it; default is the centre)
+    #a....a#         a-z portal pairs - entering one exits from its partner
+    ########
+
+The first load of a map compiles it into a binary file in .cache/ holding a
+next-cell table (for every cell and direction, where the head ends up, or -1
+for a crash), the list of free cells for food and the raw cell types. The
+cache is keyed by the SHA-256 of the text map, so editing a level rebuilds it,
+and it is memory-mapped on later loads instead of being parsed again.
+"""
+
+import hashlib
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from array import array
+
+from utils.helpers import ASSETS_DIR
+
+LEVELS_DIR = os.path.join(ASSETS_DIR, 'snake', 'levels')
+CACHE_DIR = os.path.join(LEVELS_DIR, '.cache')
+
+MAGIC = b'SNKL'
+VERSION = 2  # 2: start cells are validated before compiling
+HEADER = struct.Struct('<4sBBBxIIIi32s')
+
+# Cell types
+FLOOR, WALL, PORTAL = 0, 1, 2
+
+# Order of directions in the next-cell table
+DIRECTIONS = [(0, -1), (0, 1), (-1, 0), (1, 0)]
+DIRECTION_INDEX = {direction: i for i, direction in enumerate(DIRECTIONS)}
+
+_loaded_levels = {}
+
+
+class LevelError(ValueError):
+    """Raised when a text map cannot be parsed"""
+
+
+class Level:
+    def __init__(self, name, width, height, wrap, start, cells, next_cell, free_cells):
+        self.name = name
+        self.width = width
+        self.height = height
+        self.wrap = wrap
+        self.start = start            # (x, y) of the snake's head
+        self.cells = cells            # Cell type per cell index
+        self.next_cell = next_cell    # next_cell[cell * 4 + direction] -> cell or -1
+        self.free_cells = free_cells  # Floor cells where food may appear
+
+    def cell_index(self, position):
+        """Flat index of an (x, y) position"""
+        return position[1] * self.width + position[0]
+
+    def position(self, cell):
+        """(x, y) position of a flat cell index"""
+        return cell % self.width, cell // self.width
+
+    def cells_of_type(self, cell_type):
+        """All (x, y) positions holding the given cell type"""
+        return [self.position(i) for i, kind in enumerate(self.cells) if kind == cell_type]
+
+
+def level_path(name):
+    """Path of a level's text map"""
+    return os.path.join(LEVELS_DIR, name + '.txt')
+
+
+def available_levels():
+    """Names of all levels in the levels folder"""
+    if not os.path.isdir(LEVELS_DIR):
+        return []
+    return sorted(f[:-4] for f in os.listdir(LEVELS_DIR) if f.endswith('.txt'))
+
+
+def parse_level(text):
+    """Parse a text map into (width, height, wrap, start, cell types, portal pairs)"""
+    wrap = False
+    rows = []
+    for line in text.splitlines():
+        line = line.rstrip()
+        if not line or line.startswith(';'):
+            continue
+        if line.startswith('@'):
+            if line == '@wrap':
+                wrap = True
+                continue
+            raise LevelError(f"unknown directive {line!r}")
+        rows.append(line)
+
+    if not rows:
+        raise LevelError("level has no rows")
+    width = len(rows[0])
+    if any(len(row) != width for row in rows):
+        raise LevelError("all rows must have the same width")
+    height = len(rows)
+
+    cells = bytearray(width * height)
+    start = None
+    portal_ends = {}
+    for y, row in enumerate(rows):
+        for x, char in enumerate(row):
+            cell = y * width + x
+            if char == '#':
+                cells[cell] = WALL
+            elif char == 'S':
+                if start is not None:
+                    raise LevelError("level has more than one start 'S'")
+                start = (x, y)
+            elif 'a' <= char <= 'z':
+                cells[cell] = PORTAL
+                portal_ends.setdefault(char, []).append(cell)
+            elif char != '.':
+                raise LevelError(f"unknown map character {char!r} at row {y + 1}")
+
+    portals = {}
+    for letter, ends in portal_ends.items():
+        if len(ends) != 2:
+            raise LevelError(f"portal {letter!r} needs exactly two ends")
+        portals[ends[0]] = ends[1]
+        portals[ends[1]] = ends[0]
+
+    if start is None:
+        start = (width // 2, height // 2)
+    check_start(width, wrap, start, cells)
+    return width, height, wrap, start, cells, portals
+
+
+def check_start(width, wrap, start, cells):
+    """The snake's head and the two body cells to its left must be floor"""
+    x, y = start
+    for offset in range(3):
+        body_x = x - offset
+        if body_x < 0:
+            if not wrap:
+                raise LevelError(f"start {start} is too close to the left edge for the snake")
+            body_x %= width
+        if cells[y * width + body_x] != FLOOR:
+            raise LevelError(f"start {start} needs floor at ({body_x}, {y}) for the snake")
+
+
+def compile_level(width, height, wrap, cells, portals):
+    """Build the next-cell table and free-cell list for a parsed map"""
+    next_cell = array('i', [-1]) * (width * height * 4)
+    for cell in range(width * height):
+        x, y = cell % width, cell // width
+        for d, (dx, dy) in enumerate(DIRECTIONS):
+            nx, ny = x + dx, y + dy
+            if wrap:
+                nx %= width
+                ny %= height
+            elif not (0 <= nx < width and 0 <= ny < height):
+                continue  # Off the edge - stays -1
+
+            target = ny * width + nx
+            target = portals.get(target, target)
+            if cells[target] != WALL:
+                next_cell[cell * 4 + d] = target
+
+    free_cells = array('I', (cell for cell in range(width * height) if cells[cell] == FLOOR))
+    return next_cell, free_cells
+
+
+def write_cache(path, digest, width, height, wrap, start_cell, cells, next_cell, free_cells):
+    """Write a compiled level to its cache file"""
+    folder = os.path.dirname(path)
+    os.makedirs(folder, exist_ok=True)
+    byte_order = 0 if sys.byteorder == 'little' else 1
+
+    # A private temp file per writer keeps concurrent compiles from
+    # interleaving; whichever rename lands last wins with a complete file
+    fd, temp_path = tempfile.mkstemp(dir=folder, prefix=os.path.basename(path) + '.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(HEADER.pack(MAGIC, VERSION, byte_order, int(wrap),
+                                width, height, len(free_cells), start_cell, digest))
+            next_cell.tofile(f)
+            free_cells.tofile(f)
+            f.write(cells)
+        os.chmod(temp_path, 0o644)
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+def read_cache(path, digest):
+    """Memory-map a cache file, or return None if it is missing or stale"""
+    try:
+        with open(path, 'rb') as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+
+    try:
+        magic, version, byte_order, wrap, width, height, free_count, start_cell, cached_digest = \
+            HEADER.unpack_from(mapped, 0)
+    except struct.error:
+        mapped.close()
+        return None
+    native_order = 0 if sys.byteorder == 'little' else 1
+    cells = width * height
+    expected_size = HEADER.size + cells * 4 * 4 + free_count * 4 + cells
+    if (magic != MAGIC or version != VERSION or byte_order != native_order
+            or cached_digest != digest or len(mapped) != expected_size):
+        mapped.close()
+        return None
+
+    view = memoryview(mapped)
+    offset = HEADER.size
+    next_cell = view[offset:offset + cells * 16].cast('i')
+    offset += cells * 16
+    free_cells = view[offset:offset + free_count * 4].cast('I')
+    offset += free_count * 4
+    cell_types = view[offset:offset + cells]
+    return width, height, bool(wrap), start_cell, cell_types, next_cell, free_cells
+
+
+def load_level(name):
+    """Load a level by name, compiling and caching it when needed"""
+    path = level_path(name)
+    with open(path, 'rb') as f:
+        source = f.read()
+    digest = hashlib.sha256(source).digest()
+
+    cached = _loaded_levels.get(name)
+    if cached is not None and cached[0] == digest:
+        return cached[1]
+
+    cache_path = os.path.join(CACHE_DIR, name + '.bin')
+    compiled = read_cache(cache_path, digest)
+    if compiled is None:
+        width, height, wrap, start, cells, portals = parse_level(source.decode('utf-8'))
+        next_cell, free_cells = compile_level(width, height, wrap, cells, portals)
+        start_cell = start[1] * width + start[0]
+        try:
+            write_cache(cache_path, digest, width, height, wrap, start_cell, cells, next_cell, free_cells)
+        except OSError:
+            pass  # A read-only install still works, it just compiles each run
+        compiled = width, height, wrap, start_cell, cells, next_cell, free_cells
+
+    width, height, wrap, start_cell, cells, next_cell, free_cells = compiled
+    start = (start_cell % width, start_cell // width)
+    level = Level(name, width, height, wrap, start, cells, next_cell, free_cells)
+    _loaded_levels[name] = (digest, level)
+    return level
@@ -0,0 +1,253 @@
+"""
+📚 Tic-Tac-Toe Tablebase - Precomputed perfect play for every position
+Demonstrates: game tree search, memoization, binary files, memory mapping
+
+The generator solves every reachable position once and writes one fixed-size
+entry per board, indexed by the board read as a base-3 number (empty=0, X=1,
+O=2). That index is a perfect hash, so a lookup is a single read from the
+memory-mapped file and every process shares the same pages.
+
+Run `python -m games.tablebase --size 3` to (re)build the 3x3 file.
+"""
+
+import argparse
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from array import array
+
+from utils.helpers import ASSETS_DIR
+
+MAGIC = b'TTTB'
+VERSION = 1
+HEADER = struct.Struct('<4sBBBx')
+
+# Values are stored from the point of view of the player to move
+LOSS, DRAW, WIN = 1, 2, 3
+VALUE_NAMES = {LOSS: 'loss', DRAW: 'draw', WIN: 'win'}
+
+CELL_DIGITS = {' ': 0, 'X': 1, 'O': 2}
+
+_open_tablebases = {}
+
+
+def default_path(size):
+    """Where the tablebase for a size x size board lives"""
+    return os.path.join(ASSETS_DIR, 'tic_tac_toe', f'tablebase_{size}x{size}.bin')
+
+
+def entry_format(size):
+    """Struct format for one entry: best-move bitmask plus a 2-bit value"""
+    return '<H' if size * size + 2 <= 16 else '<I'
+
+
+def winning_lines(size):
+    """All rows, columns and diagonals as lists of flat cell indexes"""
+    lines = [[r * size + c for c in range(size)] for r in range(size)]
+    lines += [[r * size + c for r in range(size)] for c in range(size)]
+    lines.append([i * size + i for i in range(size)])
+    lines.append([i * size + size - 1 - i for i in range(size)])
+    return lines
+
+
+def board_index(board):
+    """Perfect hash of a 2D board: the cells read as a base-3 number"""
+    index = 0
+    place = 1
+    for row in board:
+        for cell in row:
+            index += CELL_DIGITS[cell] * place
+            place *= 3
+    return index
+
+
+def solve(size):
+    """Solve every position reachable from the empty board
+
+    Returns an array with one entry per base-3 index; unreachable positions
+    stay 0.
+    """
+    cells = size * size
+    value_shift = cells
+    entries = array(entry_format(size)[1], [0]) * 3 ** cells
+    lines_through = [[line for line in winning_lines(size) if cell in line] for cell in range(cells)]
+    powers = [3 ** i for i in range(cells)]
+    board = [0] * cells
+
+    # The recursion is at most size*size deep, which Python handles fine
+    def search(index, digit, empty):
+        entry = entries[index]
+        if entry:
+            return entry >> value_shift
+
+        best = LOSS - 1
+        mask = 0
+        opponent = 3 - digit
+        for cell in range(cells):
+            if board[cell]:
+                continue
+            board[cell] = digit
+            child = index + digit * powers[cell]
+            if any(all(board[i] == digit for i in line) for line in lines_through[cell]):
+                # The move wins; record the lost position for the opponent
+                entries[child] = LOSS << value_shift
+                value = WIN
+            elif empty == 1:
+                entries[child] = DRAW << value_shift
+                value = DRAW
+            else:
+                value = 4 - search(child, opponent, empty - 1)
+            board[cell] = 0
+
+            if value > best:
+                best = value
+                mask = 1 << cell
+            elif value == best:
+                mask |= 1 << cell
+
+        entries[index] = (best << value_shift) | mask
+        return best
+
+    search(0, CELL_DIGITS['X'], cells)
+    return entries
+
+
+def write_tablebase(size, path=None, entries=None):
+    """Solve a board size (unless entries are given) and write the tablebase file"""
+    path = path or default_path(size)
+    entries = _little_endian(entries if entries is not None else solve(size))
+
+    folder = os.path.dirname(os.path.abspath(path))
+    os.makedirs(folder, exist_ok=True)
+
+    # Each writer gets its own temp file, so processes building the same
+    # tablebase at once never share a file; the last rename simply wins
+    fd, temp_path = tempfile.mkstemp(dir=folder, prefix=os.path.basename(path) + '.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(HEADER.pack(MAGIC, VERSION, size, entries.itemsize))
+            entries.tofile(f)
+        os.chmod(temp_path, 0o644)
+        os.replace(temp_path, path)  # Readers never see a half-written file
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+    return path
+
+
+def _little_endian(entries):
+    """Entries in the on-disk byte order (a copy if they need swapping)"""
+    if sys.byteorder != 'little':
+        entries = array(entries.typecode, entries)
+        entries.byteswap()
+    return entries
+
+
+class Tablebase:
+    def __init__(self, path):
+        """Memory-map a tablebase file for read-only lookups
+
+        Raises ValueError if the file is not a complete tablebase of this
+        version, for example after an interrupted copy or a format change.
+        """
+        with open(path, 'rb') as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self._check(path)
+        except ValueError:
+            self._map.close()
+            raise
+
+    @classmethod
+    def in_memory(cls, size, entries):
+        """Wrap solved entries without a file, for when none can be written"""
+        data = HEADER.pack(MAGIC, VERSION, size, entries.itemsize) + _little_endian(entries).tobytes()
+        tablebase = cls.__new__(cls)
+        tablebase._map = mmap.mmap(-1, len(data))
+        tablebase._map.write(data)
+        tablebase._check('in-memory tablebase')
+        return tablebase
+
+    def _check(self, name):
+        """Validate the header and the file length"""
+        try:
+            magic, version, size, width = HEADER.unpack_from(self._map, 0)
+        except struct.error:
+            raise ValueError(f"{name} is too short to be a tablebase") from None
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{name} is not a version {VERSION} tablebase")
+
+        self.size = size
+        self._entry = struct.Struct(entry_format(size))
+        if self._entry.size != width:
+            raise ValueError(f"{name} has {width}-byte entries, expected {self._entry.size}")
+        if len(self._map) != HEADER.size + 3 ** (size * size) * width:
+            raise ValueError(f"{name} is truncated or has trailing data")
+        self._value_shift = size * size
+
+    def lookup(self, board):
+        """Return (value, best_moves) for the player to move
+
+        value is 'win', 'draw' or 'loss'; best_moves is a list of (row, col).
+        Raises KeyError for positions that cannot happen in a real game.
+        """
+        entry, = self._entry.unpack_from(self._map, HEADER.size + board_index(board) * self._entry.size)
+        value = entry >> self._value_shift
+        if not value:
+            raise KeyError("position is not reachable")
+
+        best_moves = []
+        for cell in range(self.size * self.size):
+            if entry & (1 << cell):
+                best_moves.append(divmod(cell, self.size))
+        return VALUE_NAMES[value], best_moves
+
+    def close(self):
+        """Release the memory map"""
+        self._map.close()
+
+
+def load_tablebase(size=3, path=None, build_if_missing=True):
+    """Open (and cache) the tablebase for a board size, building it if needed
+
+    A missing, stale or corrupt file is rebuilt. If the folder cannot be
+    written to, the solved table is kept in memory for this process instead.
+    """
+    path = path or default_path(size)
+    tablebase = _open_tablebases.get(path)
+    if tablebase is None:
+        try:
+            tablebase = Tablebase(path)
+            if tablebase.size != size:
+                tablebase.close()
+                raise ValueError(f"{path} is a {tablebase.size}x{tablebase.size} tablebase")
+        except (OSError, ValueError):
+            if not build_if_missing:
+                raise
+            entries = solve(size)
+            try:
+                tablebase = Tablebase(write_tablebase(size, path, entries))
+            except (OSError, ValueError):
+                tablebase = Tablebase.in_memory(size, entries)
+        _open_tablebases[path] = tablebase
+    return tablebase
+
+
+def main():
+    """Command line entry point for building tablebases"""
+    parser = argparse.ArgumentParser(description="Build a tic-tac-toe tablebase")
+    parser.add_argument("--size", type=int, default=3, choices=[3, 4],
+                        help="Board size (4x4 takes a while and ~170 MB)")
+    parser.add_argument("--output", help="Output file (default: assets/tic_tac_toe/)")
+    args = parser.parse_args()
+
+    print(f"🔄 Solving {args.size}x{args.size} tic-tac-toe...")
+    path = write_tablebase(args.size, args.output)
+    print(f"✅ Wrote {path} ({os.path.getsize(path)} bytes)")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,7 +3,10 @@
 Demonstrates: 2D arrays, game logic, user input validation, win conditions
 """
 
-from utils.helpers import clear_screen, print_colored, validate_input, animate_text
+import time
+from utils.helpers import clear_screen, print_colored, validate_input, animate_text, format_time
+from utils.telemetry import record, new_session_id
+from games.tablebase import load_tablebase
 from colorama import Fore, Style
 
 class TicTacToe:
@@ -13,6 +16,9 @@ class TicTacToe:
         self.game_over = False
         self.winner = None
         self.moves = 0
+        self.undo_stack = []  # (row, col, player) for each move made
+        self.session = new_session_id()
+        self.start_time = time.time()
         
     def print_board(self):
         """Print the current game board"""
@@ -50,11 +56,29 @@ class TicTacToe:
                 print_colored("Enter your move (row column): ", Fore.YELLOW, end="")
                 move = input().strip().split()
                 
+                if move and move[0].lower() in ['h', 'hint']:
+                    self.show_hint()
+                    continue
+                
+                if move and move[0].lower() in ['u', 'undo']:
+                    if not self.undo_stack:
+                        print_colored("There is no move to undo", Fore.RED)
+                        continue
+                    self.unmake_move()
+                    record('tic_tac_toe', 'undo', self.session)
+                    return None
+                
                 if len(move) != 2:
                     print_colored("Please enter two numbers (row and column)", Fore.RED)
                     continue
                 
-                row, col = int(move[0]) - 1, int(move[1]) - 1
+                # Only the number parsing may raise ValueError here, so
+                # errors from hints or undo are never mistaken for bad input
+                try:
+                    row, col = int(move[0]) - 1, int(move[1]) - 1
+                except ValueError:
+                    print_colored("Please enter valid numbers", Fore.RED)
+                    continue
                 
                 if not (0 <= row <= 2 and 0 <= col <= 2):
                     print_colored("Please enter numbers between 1 and 3", Fore.RED)
@@ -66,8 +90,6 @@ class TicTacToe:
                 
                 return row, col
                 
-            except ValueError:
-                print_colored("Please enter valid numbers", Fore.RED)
             except KeyboardInterrupt:
                 print_colored("\nGame interrupted. Goodbye!", Fore.CYAN)
                 exit()
@@ -76,6 +98,7 @@ class TicTacToe:
         """Make a move on the board"""
         self.board[row][col] = self.current_player
         self.moves += 1
+        self.undo_stack.append((row, col, self.current_player))
         
         # Check for win
         if self.check_winner():
@@ -87,6 +110,39 @@ class TicTacToe:
             # Switch players
             self.current_player = 'O' if self.current_player == 'X' else 'X'
     
+    def unmake_move(self):
+        """Take back the last move without copying the board"""
+        row, col, player = self.undo_stack.pop()
+        self.board[row][col] = ' '
+        self.moves -= 1
+        self.current_player = player
+        
+        # Moves can only be made while the game is running
+        self.winner = None
+        self.game_over = False
+    
+    def analyze_position(self):
+        """Look up the current position in the tablebase
+        
+        Returns (value, best_moves) for the current player, where value is
+        'win', 'draw' or 'loss' with perfect play from both sides.
+        """
+        return load_tablebase(3).lookup(self.board)
+    
+    def best_move(self):
+        """Return a perfect-play move for the current player"""
+        value, best_moves = self.analyze_position()
+        return best_moves[0]
+    
+    def show_hint(self):
+        """Tell the current player the best move and the expected result"""
+        value, best_moves = self.analyze_position()
+        record('tic_tac_toe', 'hint', self.session, value=value)
+        moves = ", ".join(f"{row + 1} {col + 1}" for row, col in best_moves)
+        outcomes = {'win': "you can force a win", 'draw': "best play is a draw",
+                    'loss': "you lose against perfect play"}
+        print_colored(f"💡 Best move(s): {moves} - {outcomes[value]}", Fore.MAGENTA)
+    
     def check_winner(self):
         """Check if current player has won"""
         # Check rows
@@ -131,6 +187,9 @@ class TicTacToe:
         self.game_over = False
         self.winner = None
         self.moves = 0
+        self.undo_stack = []  # (row, col, player) for each move made
+        self.session = new_session_id()
+        self.start_time = time.time()
     
     def show_instructions(self):
         """Show game instructions"""
@@ -148,6 +207,8 @@ class TicTacToe:
         print("• '1 1' for top-left corner")
         print("• '2 2' for center")
         print("• '3 3' for bottom-right corner")
+        print("• 'h' for a hint from the perfect-play tablebase")
+        print("• 'u' to undo the last move")
         print()
         print_colored("Press Enter to start...", Fore.CYAN)
         input()
@@ -160,8 +221,17 @@ class TicTacToe:
             self.print_board()
             
             if not self.game_over:
-                row, col = self.get_move()
-                self.make_move(row, col)
+                move = self.get_move()
+                if move:  # None means the last move was undone
+                    player = self.current_player
+                    self.make_move(*move)
+                    record('tic_tac_toe', 'move', self.session,
+                           player=player, row=move[0], col=move[1])
+                    if self.game_over:
+                        elapsed_time = time.time() - self.start_time
+                        record('tic_tac_toe', 'game_end', self.session,
+                               winner=self.winner or 'draw', moves=self.moves,
+                               duration=format_time(elapsed_time), duration_seconds=elapsed_time)
             else:
                 self.show_winner()
                 
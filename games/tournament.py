@@ -0,0 +1,267 @@
+"""
+🏆 Tournament Runner - Headless bot-vs-bot matches across all games
+Demonstrates: multiprocessing, seeded random numbers, streaming aggregation
+"""
+
+import random
+import time
+from collections import Counter
+from multiprocessing import Pool
+
+from games.snake_game import SnakeGame
+from games.snake_levels import DIRECTIONS, load_level
+from games.tic_tac_toe import TicTacToe
+from games.tablebase import load_tablebase
+from games.number_guess import NumberGuessingGame
+
+GAMES = ['snake', 'tic_tac_toe', 'number_guess']
+OUTCOMES = ['win', 'draw', 'loss']
+
+# Match settings that can be overridden from the command line
+DEFAULT_OPTIONS = {
+    'max_steps': 5000,
+    'target_score': 500,
+    'difficulty': 'hard',
+    'strategy': 'bisect',
+    'ttt_bot': 'heuristic',
+    'level': 'classic',
+}
+
+
+# ---------------------------------------------------------------------------
+# Bots
+# ---------------------------------------------------------------------------
+
+def snake_bot_move(game):
+    """Pick a direction that heads for the food without crashing"""
+    food_x, food_y = game.food
+    best_moves = []
+    best_key = None
+
+    for direction in DIRECTIONS:
+        position = game.neighbour(game.snake[0], direction)
+        if position is None or game.occupied[game.level.cell_index(position)]:
+            continue
+
+        # Prefer moves closer to the food, then moves with room to escape
+        x, y = position
+        distance = abs(food_x - x) + abs(food_y - y)
+        free_neighbours = 0
+        for next_direction in DIRECTIONS:
+            next_position = game.neighbour(position, next_direction)
+            if next_position is not None and not game.occupied[game.level.cell_index(next_position)]:
+                free_neighbours += 1
+        key = (distance, -free_neighbours)
+        if best_key is None or key < best_key:
+            best_key = key
+            best_moves = [direction]
+        elif key == best_key:
+            best_moves.append(direction)
+
+    if not best_moves:
+        return game.direction  # Trapped - keep going and crash
+    return game.rng.choice(best_moves)
+
+
+def tic_tac_toe_bot_move(game, rng):
+    """Win if possible, block if needed, otherwise take the best free cell"""
+    player = game.current_player
+    opponent = 'O' if player == 'X' else 'X'
+    free_cells = [(r, c) for r in range(3) for c in range(3) if game.board[r][c] == ' ']
+
+    for mark in [player, opponent]:
+        for row, col in free_cells:
+            game.board[row][col] = mark
+            completes_line = _has_line(game.board, mark)
+            game.board[row][col] = ' '
+            if completes_line:
+                return row, col
+
+    if (1, 1) in free_cells:
+        return 1, 1
+    corners = [cell for cell in free_cells if cell[0] != 1 and cell[1] != 1]
+    return rng.choice(corners or free_cells)
+
+
+def tic_tac_toe_perfect_move(game, rng):
+    """Pick one of the tablebase's best moves for the current player"""
+    value, best_moves = game.analyze_position()
+    return rng.choice(best_moves)
+
+
+def _has_line(board, mark):
+    """Check whether mark has three in a row anywhere on the board"""
+    lines = [[(r, c) for c in range(3)] for r in range(3)]
+    lines += [[(r, c) for r in range(3)] for c in range(3)]
+    lines += [[(i, i) for i in range(3)], [(i, 2 - i) for i in range(3)]]
+    return any(all(board[r][c] == mark for r, c in line) for line in lines)
+
+
+def number_guess_bot_guess(low, high, rng, strategy):
+    """Choose the next guess inside the remaining range"""
+    if strategy == 'random':
+        return rng.randint(low, high)
+    return (low + high) // 2
+
+
+# ---------------------------------------------------------------------------
+# Single matches - each returns (outcome, score)
+# ---------------------------------------------------------------------------
+
+def play_snake_match(rng, options):
+    """Let the snake bot play until it crashes, hits the target or times out"""
+    game = SnakeGame(headless=True, rng=rng, level=options['level'])
+    for _ in range(options['max_steps']):
+        game.direction = snake_bot_move(game)
+        game.update_game()
+        if game.game_over:
+            return ('win' if game.won else 'loss'), game.score
+        if game.score >= options['target_score']:
+            return 'win', game.score
+    return 'draw', game.score
+
+
+def play_tic_tac_toe_match(rng, options):
+    """Play the tic-tac-toe bot against itself (result is from X's side)"""
+    game = TicTacToe()
+    choose_move = tic_tac_toe_perfect_move if options['ttt_bot'] == 'perfect' else tic_tac_toe_bot_move
+    while not game.game_over:
+        row, col = choose_move(game, rng)
+        game.make_move(row, col)
+
+    if game.winner == 'X':
+        return 'win', game.moves
+    if game.winner == 'O':
+        return 'loss', game.moves
+    return 'draw', game.moves
+
+
+def play_number_guess_match(rng, options):
+    """Let a guessing strategy play one round (score is attempts used)"""
+    level_info = NumberGuessingGame().difficulty_levels[options['difficulty']]
+    low, high = level_info['range']
+    secret_number = rng.randint(low, high)
+
+    for attempts in range(1, level_info['max_attempts'] + 1):
+        guess = number_guess_bot_guess(low, high, rng, options['strategy'])
+        if guess == secret_number:
+            return 'win', attempts
+        if guess < secret_number:
+            low = guess + 1
+        else:
+            high = guess - 1
+    return 'loss', level_info['max_attempts']
+
+
+MATCH_RUNNERS = {
+    'snake': play_snake_match,
+    'tic_tac_toe': play_tic_tac_toe_match,
+    'number_guess': play_number_guess_match,
+}
+
+
+# ---------------------------------------------------------------------------
+# Process pool plumbing
+# ---------------------------------------------------------------------------
+
+def run_chunk(task):
+    """Play one chunk of matches in a worker and return a compact summary"""
+    game_name, options, seed, start, count = task
+    # Seeding per chunk keeps runs reproducible no matter which worker
+    # picks the chunk up or in which order chunks finish
+    rng = random.Random(f"{seed}:{game_name}:{start}")
+    play_match = MATCH_RUNNERS[game_name]
+
+    outcomes = Counter()
+    scores = Counter()
+    for _ in range(count):
+        outcome, score = play_match(rng, options)
+        outcomes[outcome] += 1
+        scores[score] += 1
+    return game_name, count, outcomes, scores
+
+
+def make_tasks(game_names, matches, chunk_size, seed, options):
+    """Yield chunk tasks lazily so huge runs never build a full task list"""
+    for game_name in game_names:
+        for start in range(0, matches, chunk_size):
+            count = min(chunk_size, matches - start)
+            yield game_name, options, seed, start, count
+
+
+class TournamentStats:
+    """Running totals for one game, merged from chunk summaries"""
+
+    def __init__(self, game_name):
+        self.game_name = game_name
+        self.matches = 0
+        self.outcomes = Counter()
+        self.scores = Counter()
+
+    def add_chunk(self, count, outcomes, scores):
+        """Merge a chunk summary into the totals"""
+        self.matches += count
+        self.outcomes.update(outcomes)
+        self.scores.update(scores)
+
+    def rate(self, outcome):
+        """Percentage of matches that ended with the given outcome"""
+        if self.matches == 0:
+            return 0.0
+        return self.outcomes[outcome] / self.matches * 100
+
+    def score_percentile(self, fraction):
+        """Score at the given fraction (0-1) of the distribution"""
+        if self.matches == 0:
+            return 0
+        target = fraction * (self.matches - 1)
+        seen = 0
+        for score in sorted(self.scores):
+            seen += self.scores[score]
+            if seen > target:
+                return score
+        return max(self.scores)
+
+    def summary(self):
+        """Return the aggregated results as a plain dictionary"""
+        total_score = sum(score * n for score, n in self.scores.items())
+        return {
+            'game': self.game_name,
+            'matches': self.matches,
+            'win_rate': self.rate('win'),
+            'draw_rate': self.rate('draw'),
+            'loss_rate': self.rate('loss'),
+            'score_min': min(self.scores) if self.scores else 0,
+            'score_mean': total_score / self.matches if self.matches else 0.0,
+            'score_p50': self.score_percentile(0.5),
+            'score_p90': self.score_percentile(0.9),
+            'score_max': max(self.scores) if self.scores else 0,
+        }
+
+
+def run_tournament(game_names, matches, workers=None, chunk_size=250, seed=0,
+                   options=None, on_progress=None):
+    """Run matches for each game across a process pool
+
+    Chunk summaries are merged as they arrive, so memory use does not grow
+    with the number of matches. Returns (summaries, elapsed_seconds).
+    """
+    options = dict(DEFAULT_OPTIONS, **(options or {}))
+    if 'tic_tac_toe' in game_names and options['ttt_bot'] == 'perfect':
+        # Build the tablebase once here instead of racing in every worker
+        load_tablebase(3)
+    if 'snake' in game_names:
+        # Fails fast on a bad level and compiles its cache only once
+        load_level(options['level'])
+    stats = {name: TournamentStats(name) for name in game_names}
+    tasks = make_tasks(game_names, matches, chunk_size, seed, options)
+
+    start_time = time.perf_counter()
+    with Pool(processes=workers) as pool:
+        for game_name, count, outcomes, scores in pool.imap_unordered(run_chunk, tasks):
+            stats[game_name].add_chunk(count, outcomes, scores)
+            if on_progress:
+                on_progress(sum(s.matches for s in stats.values()))
+    elapsed = time.perf_counter() - start_time
+
+    return [stats[name].summary() for name in game_names], elapsed
@@ -6,6 +6,7 @@ Welcome to your first Python game project!
 
 import sys
 import os
+import argparse
 from colorama import init, Fore, Style
 
 # Initialize colorama for cross-platform colored output
@@ -47,6 +48,45 @@ def check_dependencies():
         print(f"{Fore.YELLOW}Please run: pip install -r requirements.txt{Style.RESET_ALL}")
         return False
 
+def choose_snake_level():
+    """Let the player pick a Snake level when there is more than one"""
+    from games.snake_levels import available_levels
+    levels = available_levels()
+    if len(levels) <= 1:
+        return levels[0] if levels else 'classic'
+    
+    print(f"\n{Fore.YELLOW}🧱 Snake Levels:{Style.RESET_ALL}")
+    for i, level in enumerate(levels, 1):
+        print(f"{Fore.GREEN}{i}.{Style.RESET_ALL} {level.title()}")
+    
+    choice = input(f"{Fore.CYAN}Choose a level (1-{len(levels)}, Enter for 1): {Style.RESET_ALL}").strip()
+    if choice.isdigit() and 1 <= int(choice) <= len(levels):
+        return levels[int(choice) - 1]
+    return levels[0]
+
+def show_statistics():
+    """Roll up recorded telemetry and print totals per game"""
+    import time
+    from utils.telemetry import MinuteAggregator, get_telemetry
+    
+    print(f"\n{Fore.GREEN}📊 Game Statistics{Style.RESET_ALL}")
+    get_telemetry().rotate()  # Include this session's events
+    aggregator = MinuteAggregator()
+    aggregator.update()
+    
+    last_hour = time.strftime('%Y-%m-%d %H:%M', time.localtime(time.time() - 3600))
+    periods = [("All time", aggregator.totals()), ("Last hour", aggregator.totals(since=last_hour))]
+    if not periods[0][1]:
+        print("No games recorded yet - go play something! 🎮")
+        return
+    
+    for title, totals in periods:
+        print(f"\n{Fore.YELLOW}{title}:{Style.RESET_ALL}")
+        for game, metrics in sorted(totals.items()):
+            duration = metrics.pop('duration_seconds', 0)
+            counts = ", ".join(f"{name.replace('_', ' ')} {count}" for name, count in sorted(metrics.items()))
+            print(f"   {game}: {counts}, time played {duration / 60:.1f} min")
+
 def main():
     """Main game launcher function"""
     print_banner()
@@ -55,15 +95,24 @@ def main():
     if not check_dependencies():
         return
     
+    # Kept between rounds so replaying Snake reuses the open pygame runtime
+    snake_game = None
+    
     while True:
         try:
             choice = print_menu().strip()
             
             if choice == '1':
                 print(f"\n{Fore.GREEN}🐍 Starting Snake Game...{Style.RESET_ALL}")
-                from games.snake_game import SnakeGame
-                game = SnakeGame()
-                game.run()
+                level = choose_snake_level()
+                if snake_game is None:
+                    from games.snake_game import SnakeGame
+                    snake_game = SnakeGame(level=level)
+                else:
+                    if snake_game.level.name != level:
+                        snake_game.load_level(level)
+                    snake_game.reset_game()
+                snake_game.run()
                 
             elif choice == '2':
                 print(f"\n{Fore.GREEN}⭕ Starting Tic-Tac-Toe...{Style.RESET_ALL}")
@@ -78,8 +127,7 @@ def main():
                 game.play()
                 
             elif choice == '4':
-                print(f"\n{Fore.GREEN}📊 Game Statistics{Style.RESET_ALL}")
-                print("Feature coming soon! 🚧")
+                show_statistics()
                 
             elif choice == '5':
                 print(f"\n{Fore.CYAN}👋 Thanks for playing! See you next time!{Style.RESET_ALL}")
@@ -94,6 +142,145 @@ def main():
         except Exception as e:
             print(f"{Fore.RED}❌ An error occurred: {e}{Style.RESET_ALL}")
             print("Please try again or check your installation.")
+    
+    if snake_game is not None:
+        from utils.runtime import shutdown_runtime
+        shutdown_runtime()
+
+def run_tournament_command(args):
+    """Run headless bot-vs-bot matches and print a summary"""
+    from games.tournament import run_tournament
+
+    game_names = args.games or ['snake', 'tic_tac_toe', 'number_guess']
+    # Options left unset fall back to games.tournament.DEFAULT_OPTIONS
+    options = {
+        'max_steps': args.max_steps,
+        'target_score': args.target_score,
+        'difficulty': args.difficulty,
+        'strategy': args.strategy,
+        'ttt_bot': args.ttt_bot,
+        'level': args.level,
+    }
+    options = {name: value for name, value in options.items() if value is not None}
+    total = args.matches * len(game_names)
+    print(f"{Fore.CYAN}🏆 Running {total} matches "
+          f"({', '.join(game_names)}) with seed {args.seed}...{Style.RESET_ALL}")
+
+    def show_progress(done):
+        print(f"\r   {done}/{total} matches", end="", flush=True)
+
+    summaries, elapsed = run_tournament(
+        game_names, args.matches,
+        workers=args.workers,
+        chunk_size=args.chunk_size,
+        seed=args.seed,
+        options=options,
+        on_progress=show_progress,
+    )
+    print()
+
+    for summary in summaries:
+        print(f"\n{Fore.YELLOW}🎯 {summary['game']}{Style.RESET_ALL} ({summary['matches']} matches)")
+        print(f"   Win: {summary['win_rate']:.1f}%  "
+              f"Draw: {summary['draw_rate']:.1f}%  "
+              f"Loss: {summary['loss_rate']:.1f}%")
+        print(f"   Score: min {summary['score_min']}  "
+              f"mean {summary['score_mean']:.1f}  "
+              f"p50 {summary['score_p50']}  "
+              f"p90 {summary['score_p90']}  "
+              f"max {summary['score_max']}")
+
+    rate = total / elapsed if elapsed > 0 else 0.0
+    print(f"\n{Fore.GREEN}✅ {total} matches in {elapsed:.2f}s "
+          f"({rate:.0f} matches/sec){Style.RESET_ALL}")
+
+def run_search_benchmark_command(args):
+    """Compare undo-based and copy-based search speed"""
+    from games.search_benchmark import run_benchmark
+
+    print(f"{Fore.CYAN}⏱️ Benchmarking search ({args.repeat} runs, "
+          f"snake depth {args.depth})...{Style.RESET_ALL}")
+    results = run_benchmark(repeat=args.repeat, snake_depth=args.depth, seed=args.seed)
+
+    baseline = {}
+    for result in results:
+        if result['method'] == 'copy':
+            baseline[result['game']] = result['nodes_per_sec']
+
+    for result in results:
+        line = (f"   {result['game']:<12} {result['method']:<12} "
+                f"{result['nodes']:>9} nodes  {result['nodes_per_sec']:>12,.0f} nodes/sec")
+        if result['method'] != 'copy' and baseline.get(result['game']):
+            line += f"  ({result['nodes_per_sec'] / baseline[result['game']]:.1f}x vs copy)"
+        print(line)
+
+def positive_int(value):
+    """argparse type for counts that must be at least 1"""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"{value!r} is not a whole number")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"{value} must be at least 1")
+    return number
+
+def build_parser():
+    """Build the command line parser (no command opens the menu)"""
+    from games.snake_levels import available_levels
+
+    parser = argparse.ArgumentParser(description="Python Games Collection")
+    subparsers = parser.add_subparsers(dest="command")
+
+    tournament = subparsers.add_parser(
+        "tournament", help="Run headless bot-vs-bot matches in parallel",
+        epilog="Snake, tic-tac-toe and number guessing options that are not given "
+               "use DEFAULT_OPTIONS from games/tournament.py.")
+    tournament.add_argument("--games", nargs="+",
+                            choices=['snake', 'tic_tac_toe', 'number_guess'],
+                            help="Games to run (default: all)")
+    tournament.add_argument("--matches", type=positive_int, default=1000,
+                            help="Matches per game")
+    tournament.add_argument("--workers", type=positive_int, default=None,
+                            help="Worker processes (default: one per core)")
+    tournament.add_argument("--chunk-size", type=positive_int, default=250,
+                            help="Matches sent to a worker at a time")
+    tournament.add_argument("--seed", type=int, default=0,
+                            help="Base seed for reproducible runs")
+    tournament.add_argument("--max-steps", type=positive_int,
+                            help="Snake: steps before a match counts as a draw")
+    tournament.add_argument("--target-score", type=positive_int,
+                            help="Snake: score that counts as a win")
+    tournament.add_argument("--level", choices=available_levels(),
+                            help="Snake: level from assets/snake/levels")
+    tournament.add_argument("--difficulty",
+                            choices=['easy', 'medium', 'hard', 'expert'],
+                            help="Number guessing: difficulty level")
+    tournament.add_argument("--strategy",
+                            choices=['bisect', 'random'],
+                            help="Number guessing: guessing strategy")
+    tournament.add_argument("--ttt-bot",
+                            choices=['heuristic', 'perfect'],
+                            help="Tic-tac-toe: bot used for both players")
+
+    bench = subparsers.add_parser(
+        "bench-search", help="Compare make/unmake search with copy-based search")
+    bench.add_argument("--repeat", type=positive_int, default=3,
+                       help="Searches per game and method")
+    bench.add_argument("--depth", type=positive_int, default=6,
+                       help="Snake: search depth in ticks")
+    bench.add_argument("--seed", type=int, default=0,
+                       help="Snake: seed for food placement")
+
+    subparsers.add_parser("stats", help="Show statistics from recorded game telemetry")
+    return parser
 
 if __name__ == "__main__":
-    main()
+    args = build_parser().parse_args()
+    if args.command == "tournament":
+        run_tournament_command(args)
+    elif args.command == "bench-search":
+        run_search_benchmark_command(args)
+    elif args.command == "stats":
+        show_statistics()
+    else:
+        main()
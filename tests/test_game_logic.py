@@ -0,0 +1,394 @@
+"""
+Checks for the game logic that has to stay exact: the tic-tac-toe tablebase,
+make/unmake, compiled snake levels and the telemetry rollup.
+
+Run with `python -m pytest -q` from the project folder.
+"""
+
+import gzip
+import io
+import json
+import random
+import subprocess
+import sys
+import time
+
+import pytest
+
+import games.snake_levels
+from games.snake_game import SnakeGame
+from games.snake_levels import (DIRECTION_INDEX, DIRECTIONS, LevelError, available_levels,
+                                compile_level, level_path, parse_level)
+import games.tic_tac_toe
+from games.tablebase import Tablebase, load_tablebase, write_tablebase
+from games.tic_tac_toe import TicTacToe
+from games.tournament import snake_bot_move
+from utils.telemetry import MinuteAggregator, TelemetryWriter
+
+
+# ---------------------------------------------------------------------------
+# Tic-Tac-Toe
+# ---------------------------------------------------------------------------
+
+@pytest.fixture(scope='module')
+def tablebase(tmp_path_factory):
+    path = write_tablebase(3, str(tmp_path_factory.mktemp('tablebase') / 'tablebase_3x3.bin'))
+    tablebase = Tablebase(path)
+    yield tablebase
+    tablebase.close()
+
+
+def brute_force(game, memo):
+    """Plain minimax: (value for the player to move, best moves)"""
+    key = ''.join(cell for row in game.board for cell in row)
+    if key not in memo:
+        scores = {}
+        for row in range(3):
+            for col in range(3):
+                if game.board[row][col] != ' ':
+                    continue
+                game.make_move(row, col)
+                if game.winner:
+                    scores[row, col] = 1
+                elif game.game_over:
+                    scores[row, col] = 0
+                else:
+                    scores[row, col] = -brute_force(game, memo)[0]
+                game.unmake_move()
+        best = max(scores.values())
+        memo[key] = best, sorted(move for move, score in scores.items() if score == best)
+    return memo[key]
+
+
+def test_tablebase_matches_brute_force_minimax(tablebase):
+    names = {1: 'win', 0: 'draw', -1: 'loss'}
+    memo = {}
+    game = TicTacToe()
+    positions = 0
+    mismatches = []
+
+    def walk():
+        nonlocal positions
+        positions += 1
+        if game.game_over:
+            return
+        value, best_moves = brute_force(game, memo)
+        if tablebase.lookup(game.board) != (names[value], best_moves):
+            mismatches.append([row[:] for row in game.board])
+        for row in range(3):
+            for col in range(3):
+                if game.board[row][col] == ' ':
+                    game.make_move(row, col)
+                    walk()
+                    game.unmake_move()
+
+    walk()
+    assert positions == 549946  # Every node of the full game tree
+    assert mismatches == []
+
+
+def test_tablebase_rejects_unreachable_positions(tablebase):
+    with pytest.raises(KeyError):
+        tablebase.lookup([['X', 'X', 'X'], ['X', ' ', ' '], [' ', ' ', ' ']])
+
+
+
+@pytest.mark.parametrize('junk', [b'', b'TTTB', b'not a tablebase at all', None])
+def test_tablebase_rebuilds_a_bad_file(tmp_path, junk):
+    path = tmp_path / 'tablebase_3x3.bin'
+    if junk is None:
+        # Right header, but cut short
+        write_tablebase(3, str(path))
+        path.write_bytes(path.read_bytes()[:-100])
+    else:
+        path.write_bytes(junk)
+    tablebase = load_tablebase(3, str(path))
+    assert tablebase.lookup([[' '] * 3 for _ in range(3)])[0] == 'draw'
+    assert Tablebase(str(path)).size == 3  # The file on disk was replaced
+
+
+def test_tablebase_works_without_a_writable_folder(tmp_path):
+    blocker = tmp_path / 'not_a_folder'
+    blocker.write_text('')
+    tablebase = load_tablebase(3, str(blocker / 'tablebase_3x3.bin'))
+    assert tablebase.lookup([['X', ' ', ' '], [' ', ' ', ' '], [' ', ' ', ' ']]) == ('draw', [(1, 1)])
+
+
+def test_hint_errors_are_not_reported_as_bad_input(monkeypatch):
+    def broken_tablebase(size):
+        raise ValueError("tablebase exploded")
+
+    monkeypatch.setattr(games.tic_tac_toe, 'load_tablebase', broken_tablebase)
+    monkeypatch.setattr('builtins.input', lambda: 'h')
+    with pytest.raises(ValueError, match="exploded"):
+        TicTacToe().get_move()
+
+def test_tic_tac_toe_make_unmake_round_trip():
+    game = TicTacToe()
+    moves = [(1, 1), (0, 0), (2, 2), (0, 2), (0, 1), (2, 1), (1, 0), (1, 2), (2, 0)]
+    states = []
+    for row, col in moves:
+        states.append(([r[:] for r in game.board], game.current_player, game.moves))
+        game.make_move(row, col)
+    assert game.game_over and game.winner is None
+
+    for board, player, moves_made in reversed(states):
+        game.unmake_move()
+        assert (game.board, game.current_player, game.moves) == (board, player, moves_made)
+        assert not game.game_over and game.winner is None
+    assert game.undo_stack == []
+
+
+# ---------------------------------------------------------------------------
+# Snake levels
+# ---------------------------------------------------------------------------
+
+def compile_text(text):
+    width, height, wrap, start, cells, portals = parse_level(text)
+    next_cell, free_cells = compile_level(width, height, wrap, cells, portals)
+
+    def step(position, direction):
+        cell = next_cell[(position[1] * width + position[0]) * 4 + DIRECTION_INDEX[direction]]
+        return None if cell == -1 else (cell % width, cell // width)
+
+    return step, free_cells, start
+
+
+def test_level_next_cell_walls_and_edges():
+    step, free_cells, start = compile_text(
+        "..#..\n"
+        "..S..\n"
+    )
+    assert step((1, 0), (1, 0)) is None      # Wall
+    assert step((0, 0), (-1, 0)) is None     # Left edge
+    assert step((4, 1), (0, 1)) is None      # Bottom edge
+    assert step((1, 1), (0, -1)) == (1, 0)
+    assert len(free_cells) == 9              # The start is floor too
+    assert start == (2, 1)
+
+
+def test_level_next_cell_wraps():
+    step, free_cells, start = compile_text(
+        "@wrap\n"
+        "#...\n"
+        "....\n"
+    )
+    assert step((3, 1), (1, 0)) == (0, 1)
+    assert step((1, 0), (0, -1)) == (1, 1)
+    assert step((3, 0), (1, 0)) is None      # Wraps into a wall
+
+
+def test_level_next_cell_portals():
+    step, free_cells, start = compile_text(
+        "a....\n"
+        ".....\n"
+        "...Sb\n"
+        "....a\n"
+        "b....\n"
+    )
+    # Entering a portal exits from its partner
+    assert step((1, 0), (-1, 0)) == (4, 3)
+    assert step((3, 2), (1, 0)) == (0, 4)
+    assert (0, 0) not in [(cell % 5, cell // 5) for cell in free_cells]
+
+
+@pytest.mark.parametrize('text', [
+    "#####\n#S..#\n#####\n",    # Body in a wall
+    "....\n.S..\n....\n",       # Body off the left edge
+    "....\n....\n#...\n....\n",  # Default centre start with a wall behind it
+    "..S.S\n",                  # Two starts
+])
+def test_level_rejects_bad_starts(text):
+    with pytest.raises(LevelError):
+        parse_level(text)
+
+
+def test_level_start_may_wrap_on_wrap_maps():
+    assert parse_level("@wrap\n.....\nS....\n")[3] == (0, 1)
+
+
+def test_shipped_levels_parse():
+    assert {'classic', 'maze', 'wrap'} <= set(available_levels())
+    for name in available_levels():
+        with open(level_path(name), encoding='utf-8') as f:
+            parse_level(f.read())
+
+
+# ---------------------------------------------------------------------------
+# Snake step/undo
+# ---------------------------------------------------------------------------
+
+def snake_state(game):
+    return (list(game.snake), bytes(game.occupied), game.direction,
+            game.food, game.score, game.game_over)
+
+
+@pytest.mark.parametrize('level', ['classic', 'maze', 'wrap'])
+def test_snake_step_undo_round_trip(level):
+    game = SnakeGame(headless=True, rng=random.Random(level), level=level)
+    history = []
+    for _ in range(300):
+        # Every direction, including crashes, must undo cleanly
+        before = snake_state(game)
+        for direction in DIRECTIONS:
+            game.step(direction)
+            game.undo_step()
+            assert snake_state(game) == before
+
+        history.append(before)
+        if game.step(snake_bot_move(game)) == 'crash':
+            break
+    assert game.score > 0  # The walk ate something, so growth was undone too
+
+    while history:
+        game.undo_step()
+        assert snake_state(game) == history.pop()
+    assert not game.undo_stack
+
+
+
+def test_snake_applies_two_quick_turns_on_consecutive_ticks():
+    game = SnakeGame(headless=True, rng=random.Random(0))
+    x, y = game.snake[0]
+    game.queue_turn((0, -1))
+    game.queue_turn((-1, 0))  # Up then left before the next tick
+
+    game.update_game()
+    assert game.direction == (0, -1) and game.snake[0] == (x, y - 1)
+    game.update_game()
+    assert game.direction == (-1, 0) and game.snake[0] == (x - 1, y - 1)
+    assert not game.input_queue
+
+
+def test_snake_skips_a_reverse_turn_and_applies_the_next():
+    game = SnakeGame(headless=True, rng=random.Random(0))
+    game.queue_turn((-1, 0))  # Straight back into the body
+    game.queue_turn((0, 1))
+    game.update_game()
+    assert game.direction == (0, 1) and not game.game_over
+    assert not game.input_queue
+
+
+def test_snake_input_queue_is_limited():
+    game = SnakeGame(headless=True, rng=random.Random(0))
+    for direction in [(0, -1), (0, -1), (-1, 0), (0, -1), (-1, 0), (0, 1)]:
+        game.queue_turn(direction)
+    queued = [direction for direction, pressed_at in game.input_queue]
+    assert queued == [(0, -1), (-1, 0), (0, -1)]  # Repeats share a slot, extras are dropped
+
+
+def test_snake_latency_report_uses_nearest_rank_p95():
+    game = SnakeGame(headless=True, rng=random.Random(0))
+    game.input_latencies.extend(range(1, 11))
+    report = game.latency_report()
+    assert report == {'turns': 10, 'average': 5.5, 'p95': 10, 'max': 10}
+
+def test_snake_wins_when_it_fills_the_level(tmp_path, monkeypatch):
+    monkeypatch.setattr(games.snake_levels, 'LEVELS_DIR', str(tmp_path))
+    monkeypatch.setattr(games.snake_levels, 'CACHE_DIR', str(tmp_path / '.cache'))
+    (tmp_path / 'tiny.txt').write_text("@wrap\n..S.\n")
+
+    game = SnakeGame(headless=True, rng=random.Random(0), level='tiny')
+    assert game.food == (3, 0)  # The only cell the snake is not on
+    before = snake_state(game)
+    assert game.step((1, 0)) == 'win'
+    assert game.game_over and game.won and game.food is None
+
+    game.undo_step()
+    assert snake_state(game) == before and not game.won
+
+
+# ---------------------------------------------------------------------------
+# Telemetry rollup
+# ---------------------------------------------------------------------------
+
+def write_segment(path, lines):
+    with gzip.open(path, 'wt', encoding='utf-8') as f:
+        f.write(''.join(line + '\n' for line in lines))
+
+
+def eat_event(ts=0):
+    return json.dumps({'ts': ts, 'game': 'snake', 'event': 'eat', 'session': 's'})
+
+
+def test_aggregator_reads_each_segment_once(tmp_path):
+    write_segment(tmp_path / 'events-1.jsonl.gz', [eat_event()] * 3)
+    aggregator = MinuteAggregator(str(tmp_path))
+    assert aggregator.update() == 1
+    assert aggregator.update() == 0
+
+    write_segment(tmp_path / 'events-2.jsonl.gz', [eat_event()] * 2)
+    write_segment(tmp_path / 'events-3.jsonl.gz.part', [eat_event()] * 7)  # Still open
+    aggregator.update()
+    assert aggregator.totals() == {'snake': {'eat': 5}}
+
+    # A fresh aggregator picks the totals up from the state file
+    reloaded = MinuteAggregator(str(tmp_path))
+    reloaded.update()
+    assert reloaded.totals() == {'snake': {'eat': 5}}
+
+
+def test_aggregator_skips_a_partly_bad_segment_without_double_counting(tmp_path):
+    write_segment(tmp_path / 'events-1.jsonl.gz', [eat_event()] * 5 + ['{not json'])
+    write_segment(tmp_path / 'events-2.jsonl.gz', [eat_event()] * 2)
+    aggregator = MinuteAggregator(str(tmp_path))
+    assert aggregator.update() == 2
+    assert aggregator.totals() == {'snake': {'eat': 2}}
+    assert aggregator.damaged == {'events-1.jsonl.gz'}
+
+    # The damaged segment is remembered, not read again on every update
+    assert aggregator.update() == 0
+    reloaded = MinuteAggregator(str(tmp_path))
+    assert reloaded.update() == 0
+    assert reloaded.totals() == {'snake': {'eat': 2}}
+    assert [p.name for p in tmp_path.iterdir() if p.name.endswith('.tmp')] == []
+
+
+def test_aggregator_totals_since(tmp_path):
+    now = time.time()
+    write_segment(tmp_path / 'events-1.jsonl.gz', [eat_event(now - 7200), eat_event(now)])
+    aggregator = MinuteAggregator(str(tmp_path))
+    aggregator.update()
+    since = time.strftime('%Y-%m-%d %H:%M', time.localtime(now - 60))
+    assert aggregator.totals() == {'snake': {'eat': 2}}
+    assert aggregator.totals(since) == {'snake': {'eat': 1}}
+
+
+def test_writer_round_trip_and_close_after_writer_died(tmp_path):
+    writer = TelemetryWriter(str(tmp_path), flush_interval=0.05)
+    writer.record('number_guess', 'round_end', 's', duration_seconds=1.5)
+    writer.rotate()
+    aggregator = MinuteAggregator(str(tmp_path))
+    aggregator.update()
+    assert aggregator.totals() == {'number_guess': {'round_end': 1, 'duration_seconds': 1.5}}
+
+    # Stop the thread behind the writer's back and fill the queue
+    writer._queue.put(None)
+    writer._thread.join()
+    writer._queue = type(writer._queue)(maxsize=1)
+    writer._queue.put({})
+    started = time.monotonic()
+    writer.rotate(timeout=0.2)
+    writer.close(timeout=0.2)
+    assert time.monotonic() - started < 1
+
+
+def test_writer_recovers_segments_left_by_a_crash(tmp_path):
+    # A process that has exited stands in for a writer that crashed
+    crashed = subprocess.Popen([sys.executable, '-c', 'pass'])
+    crashed.wait()
+
+    # Flushed but never closed, like a segment whose writer was killed
+    stream = io.BytesIO()
+    segment = gzip.GzipFile(fileobj=stream, mode='wb')
+    segment.write(''.join(eat_event() + '\n' for _ in range(4)).encode('utf-8'))
+    segment.write(b'{"ts": 0, "ga')  # Cut off mid-event
+    segment.flush()
+    part = tmp_path / f'events-20260101-000000-{crashed.pid}-0001.jsonl.gz.part'
+    part.write_bytes(stream.getvalue())
+
+    TelemetryWriter(str(tmp_path)).close()
+    assert not part.exists()
+    aggregator = MinuteAggregator(str(tmp_path))
+    aggregator.update()
+    assert aggregator.totals() == {'snake': {'eat': 4}}
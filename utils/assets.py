@@ -0,0 +1,195 @@
+"""
+Asset loading for pygame games - sprites, sounds and fonts
+
+Sprites are loaded in a background thread while the window opens, converted
+to the display format once, and packed into a single texture atlas so a whole
+frame of tiles can be drawn with one Surface.blits call.
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+
+import pygame
+
+from utils.colors import GameColors
+from utils.helpers import ASSETS_DIR
+
+SPRITE_EXTENSIONS = ('.png', '.bmp', '.gif', '.jpg')
+SOUND_EXTENSIONS = ('.ogg', '.wav', '.mp3')
+
+
+SOUND_CACHE_SIZE = 32
+
+_sounds = OrderedDict()  # Least recently used sound first
+_sounds_lock = threading.Lock()
+_quit_hook_registered = False
+
+
+@lru_cache(maxsize=16)
+def _load_font(name, size):
+    """Load a font (cached by get_font)"""
+    return pygame.font.Font(name, size)
+
+
+def _watch_for_quit():
+    """Make sure pygame.quit() empties the caches before it frees anything"""
+    global _quit_hook_registered
+    if not _quit_hook_registered:
+        pygame.register_quit(_on_pygame_quit)
+        _quit_hook_registered = True
+
+
+def _on_pygame_quit():
+    """pygame.quit() hook - cached fonts and sounds die with pygame"""
+    global _quit_hook_registered
+    _quit_hook_registered = False  # pygame forgets its hooks after running them
+    clear_caches()
+
+
+def get_font(name, size):
+    """Return a shared font (None means pygame's default font)"""
+    if not pygame.font.get_init():
+        pygame.font.init()
+    _watch_for_quit()
+    return _load_font(name, size)
+
+
+def get_sound(path):
+    """Return a shared sound, or None if audio is not available
+
+    Failures are not cached, so a sound asked for before the mixer starts
+    still loads once it is running.
+    """
+    with _sounds_lock:
+        if not pygame.mixer.get_init():
+            _sounds.clear()  # Sounds do not survive the mixer shutting down
+            return None
+
+        sound = _sounds.get(path)
+        if sound is not None:
+            _sounds.move_to_end(path)
+            return sound
+
+        try:
+            sound = pygame.mixer.Sound(path)
+        except pygame.error:
+            return None
+        _watch_for_quit()
+        _sounds[path] = sound
+        if len(_sounds) > SOUND_CACHE_SIZE:
+            _sounds.popitem(last=False)
+        return sound
+
+
+def clear_caches():
+    """Forget every cached font and sound (call before pygame.quit())"""
+    _load_font.cache_clear()
+    with _sounds_lock:
+        _sounds.clear()
+
+
+def find_asset(folder, name, extensions):
+    """Find the first file called name.<ext> in folder"""
+    for extension in extensions:
+        path = os.path.join(folder, name + extension)
+        if os.path.isfile(path):
+            return path
+    return None
+
+
+class AssetManager:
+    def __init__(self, theme, tiles, sounds=(), tile_size=20, assets_dir=ASSETS_DIR):
+        """tiles maps tile names to (fill, border) colours used when a sprite is missing"""
+        self.theme = theme
+        self.tiles = tiles
+        self.sound_names = list(sounds)
+        self.tile_size = tile_size
+        self.theme_dir = os.path.join(assets_dir, theme)
+
+        self.atlas = None
+        self.tile_rects = {}
+        self.sounds = {}
+        self._raw_sprites = {}
+        self._loader = None
+
+    def start_loading(self):
+        """Start reading sprite and sound files in a background thread"""
+        self._loader = threading.Thread(target=self._load_files, daemon=True)
+        self._loader.start()
+
+    def _load_files(self):
+        """Read files from disk (runs in the loader thread)"""
+        sprites_dir = os.path.join(self.theme_dir, 'sprites')
+        for name in self.tiles:
+            path = find_asset(sprites_dir, name, SPRITE_EXTENSIONS)
+            if path:
+                try:
+                    self._raw_sprites[name] = pygame.image.load(path)
+                except pygame.error:
+                    pass  # Fall back to the plain coloured tile
+
+        sounds_dir = os.path.join(self.theme_dir, 'sounds')
+        for name in self.sound_names:
+            path = find_asset(sounds_dir, name, SOUND_EXTENSIONS)
+            if path:
+                self.sounds[name] = get_sound(path)
+
+    def finish_loading(self):
+        """Wait for the loader and build the atlas (needs an open display)"""
+        if self.atlas is not None:
+            return  # Already built by an earlier game session
+        if self._loader is None:
+            self.start_loading()
+        self._loader.join()
+        self._loader = None
+        self.build_atlas()
+
+    def build_atlas(self):
+        """Pack every tile into one surface converted to the display format"""
+        size = self.tile_size
+        uses_alpha = any(sprite.get_alpha() is not None or sprite.get_colorkey()
+                         for sprite in self._raw_sprites.values())
+        flags = pygame.SRCALPHA if uses_alpha else 0
+        atlas = pygame.Surface((size * len(self.tiles), size), flags)
+
+        for index, (name, (fill, border)) in enumerate(self.tiles.items()):
+            rect = pygame.Rect(index * size, 0, size, size)
+            sprite = self._raw_sprites.get(name)
+            if sprite is not None:
+                if sprite.get_size() != (size, size):
+                    sprite = pygame.transform.smoothscale(sprite, (size, size))
+                atlas.blit(sprite, rect)
+            else:
+                pygame.draw.rect(atlas, fill, rect)
+                if border:
+                    pygame.draw.rect(atlas, border, rect, 1)
+            self.tile_rects[name] = rect
+
+        self.atlas = atlas.convert_alpha() if uses_alpha else atlas.convert()
+        self._raw_sprites.clear()
+
+    def draw_tiles(self, screen, placements):
+        """Draw (tile_name, (x, y)) pairs in a single batched blit"""
+        atlas = self.atlas
+        rects = self.tile_rects
+        screen.blits([(atlas, position, rects[name]) for name, position in placements],
+                     doreturn=False)
+
+    def play_sound(self, name):
+        """Play a themed sound if it was found and audio is available"""
+        sound = self.sounds.get(name)
+        if sound is not None:
+            sound.play()
+
+
+# Fallback colours reproduce the original rectangle graphics
+SNAKE_TILES = {
+    'head': (GameColors.SNAKE_HEAD, GameColors.TEXT),
+    'body': (GameColors.SNAKE_BODY, GameColors.TEXT),
+    'food': (GameColors.FOOD, None),
+    'wall': (GameColors.WALL, GameColors.BORDER),
+    'portal': (GameColors.PORTAL, GameColors.TEXT),
+}
+SNAKE_SOUNDS = ('eat', 'game_over')
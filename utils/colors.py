@@ -23,3 +23,5 @@ class GameColors:
     BACKGROUND = (0, 0, 0)        # Black
     TEXT = (255, 255, 255)        # White
     BORDER = (128, 128, 128)      # Gray
+    WALL = (100, 100, 120)        # Slate
+    PORTAL = (0, 150, 255)        # Blue
@@ -2,18 +2,22 @@
 Helper functions for games
 """
 
+import os
 import random
 import time
 from colorama import Fore, Style
 
+# Folder holding sprites, sounds and generated game data
+ASSETS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'assets')
+
 def clear_screen():
     """Clear the console screen"""
     import os
     os.system('cls' if os.name == 'nt' else 'clear')
 
-def print_colored(text, color=Fore.WHITE):
+def print_colored(text, color=Fore.WHITE, end="\n"):
     """Print colored text"""
-    print(f"{color}{text}{Style.RESET_ALL}")
+    print(f"{color}{text}{Style.RESET_ALL}", end=end)
 
 def get_random_position(width, height):
     """Get a random position within given bounds"""
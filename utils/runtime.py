@@ -0,0 +1,78 @@
+"""
+Long-lived pygame runtime shared by every game session
+
+pygame is initialized once and the window is hidden between sessions instead
+of being destroyed, so going back into a game from the menu skips SDL start-up,
+window creation and font/atlas loading.
+"""
+
+import pygame
+
+from utils.assets import clear_caches
+
+
+class PygameRuntime:
+    def __init__(self):
+        self.screen = None
+        self.size = None
+        self.clock = None
+        self.shared = {}  # Per-game resources such as asset atlases
+
+    def start(self):
+        """Initialize pygame (including the mixer) if it is not running"""
+        if not pygame.get_init():
+            # Surfaces built before an earlier pygame.quit() are dead
+            self.shared.clear()
+            pygame.init()
+            self.clock = pygame.time.Clock()
+
+    def show(self, size, caption):
+        """Show the window at the given size, creating it the first time"""
+        self.start()
+
+        # SDL2 reuses the existing window when set_mode is called again
+        self.screen = pygame.display.set_mode(size, pygame.SHOWN)
+        self.size = size
+        pygame.display.set_caption(caption)
+
+        # Drop key presses that arrived while the window was hidden
+        pygame.event.clear()
+        return self.screen
+
+    def hide(self):
+        """Hide the window but keep pygame, fonts and surfaces alive"""
+        if self.screen is not None:
+            self.screen = pygame.display.set_mode(self.size, pygame.HIDDEN)
+
+    def get_shared(self, key, factory):
+        """Return a cached resource, building it with factory() on first use"""
+        if key not in self.shared:
+            self.shared[key] = factory()
+        return self.shared[key]
+
+    def shutdown(self):
+        """Quit pygame and forget everything that depended on it"""
+        self.shared.clear()
+        clear_caches()
+        self.screen = None
+        self.size = None
+        self.clock = None
+        if pygame.get_init():
+            pygame.quit()
+
+
+_runtime = None
+
+
+def get_runtime():
+    """Return the process-wide pygame runtime"""
+    global _runtime
+    if _runtime is None:
+        _runtime = PygameRuntime()
+    return _runtime
+
+
+def shutdown_runtime():
+    """Shut the shared runtime down if it was ever started"""
+    if _runtime is not None:
+        _runtime.shutdown()
@@ -0,0 +1,367 @@
+"""
+Session telemetry - an append-only event stream for every game
+
+Games call record() to log moves, guesses, hints, food eaten and round
+durations. Events go onto a queue and a background thread writes them in
+batches to gzip-compressed JSONL segments, so gameplay never waits on disk.
+Segments are written as .part files and renamed when they are rotated, so
+readers only ever see complete files.
+
+MinuteAggregator rolls closed segments up into per-minute counts and keeps
+its totals in a state file, so each segment is read exactly once; segments
+that turn out to be damaged are listed there too and not read again.
+
+Set GAMES_TELEMETRY=off to disable recording, or GAMES_TELEMETRY_DIR to
+write somewhere other than telemetry/ in the project folder.
+
+The open segment is flushed every flush_interval seconds. If a process dies
+without closing its segment, the next writer to start salvages the complete
+events from the leftover .part file and publishes them as a normal segment.
+"""
+
+import atexit
+import gzip
+import json
+import os
+import queue
+import tempfile
+import threading
+import time
+import uuid
+import zlib
+
+TELEMETRY_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'telemetry')
+
+SEGMENT_SUFFIX = '.jsonl.gz'
+PART_SUFFIX = '.part'
+STATE_FILE = 'rollup.json'
+
+_writer = None
+_writer_lock = threading.Lock()
+
+
+def new_session_id():
+    """Short random id that ties together the events of one game session"""
+    return uuid.uuid4().hex[:12]
+
+
+class TelemetryWriter:
+    def __init__(self, directory=TELEMETRY_DIR, max_segment_events=50000,
+                 max_segment_age=3600, flush_interval=1.0, queue_size=10000):
+        self.directory = directory
+        self.max_segment_events = max_segment_events
+        self.max_segment_age = max_segment_age
+        self.flush_interval = flush_interval
+        self.dropped = 0  # Events lost because the queue was full
+
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._segment = None
+        self._segment_path = None
+        self._segment_events = 0
+        self._segment_opened = 0
+        self._segment_number = 0
+        self._unflushed = False
+        self._last_flush = 0
+        self._closed = False
+
+        os.makedirs(directory, exist_ok=True)
+        recover_segments(directory, max_segment_age)
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def record(self, game, event, session=None, **fields):
+        """Queue one event without blocking the caller"""
+        if self._closed:
+            return
+        fields.update(ts=time.time(), game=game, event=event, session=session)
+        try:
+            self._queue.put_nowait(fields)
+        except queue.Full:
+            self.dropped += 1
+
+    def _run(self):
+        """Background loop: batch queued events into the current segment"""
+        while True:
+            batch = []
+            try:
+                batch.append(self._queue.get(timeout=self.flush_interval))
+                while len(batch) < 1000:
+                    batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                pass
+
+            # Besides event dicts the queue carries None (stop) and
+            # threading.Event objects (rotate now and signal when done)
+            events = [item for item in batch if isinstance(item, dict)]
+            if events:
+                self._write(events)
+            elif self._segment and time.time() - self._segment_opened >= self.max_segment_age:
+                self._finish_segment()  # Don't leave a quiet segment open forever
+
+            # Push buffered events to disk so a crash loses at most one interval
+            if self._unflushed and time.time() - self._last_flush >= self.flush_interval:
+                self._segment.flush()
+                self._unflushed = False
+                self._last_flush = time.time()
+
+            for item in batch:
+                if item is None:
+                    self._finish_segment()
+                    return
+                if isinstance(item, threading.Event):
+                    self._finish_segment()
+                    item.set()
+
+    def _write(self, events):
+        """Append events to the segment, rotating it when it is full or old"""
+        if self._segment is None:
+            self._open_segment()
+        lines = ''.join(json.dumps(event, separators=(',', ':')) + '\n' for event in events)
+        self._segment.write(lines.encode('utf-8'))
+        self._segment_events += len(events)
+        self._unflushed = True
+
+        if (self._segment_events >= self.max_segment_events
+                or time.time() - self._segment_opened >= self.max_segment_age):
+            self._finish_segment()
+
+    def _open_segment(self):
+        """Start a new segment file named so that segments sort by time"""
+        self._segment_number += 1
+        stamp = time.strftime('%Y%m%d-%H%M%S')
+        name = f"events-{stamp}-{os.getpid()}-{self._segment_number:04d}{SEGMENT_SUFFIX}"
+        self._segment_path = os.path.join(self.directory, name)
+        self._segment = gzip.open(self._segment_path + PART_SUFFIX, 'wb')
+        self._segment_events = 0
+        self._segment_opened = time.time()
+        self._last_flush = self._segment_opened
+
+    def _finish_segment(self):
+        """Close the current segment and publish it for aggregation"""
+        if self._segment is None:
+            return
+        self._segment.close()
+        os.replace(self._segment_path + PART_SUFFIX, self._segment_path)
+        self._segment = None
+        self._unflushed = False
+
+    def _send(self, marker, timeout):
+        """Queue a control marker; False if the writer thread cannot take it"""
+        if not self._thread.is_alive():
+            return False  # A dead writer would never drain the queue
+        try:
+            self._queue.put(marker, timeout=timeout)
+        except queue.Full:
+            return False
+        return True
+
+    def rotate(self, timeout=5.0):
+        """Publish the open segment now so aggregators can read it"""
+        if self._closed:
+            return
+        done = threading.Event()
+        if self._send(done, timeout):
+            done.wait(timeout)
+
+    def close(self, timeout=5.0):
+        """Write everything still queued and close the open segment"""
+        if self._closed:
+            return
+        self._closed = True
+        if self._send(None, timeout):
+            self._thread.join(timeout)
+
+
+def _writer_gone(name, path, max_segment_age):
+    """Whether the process that was writing a .part segment has stopped"""
+    try:
+        pid = int(name.split('-')[3])
+    except (IndexError, ValueError):
+        return True  # Not one of ours, so nobody will ever finish it
+    if pid == os.getpid():
+        return False
+    if os.name == 'posix':
+        try:
+            os.kill(pid, 0)  # Signal 0 only checks that the process exists
+        except (ProcessLookupError, OverflowError):
+            return True
+        except OSError:
+            pass  # It exists but belongs to someone else
+        return False
+    # Without a safe PID check, rely on live writers closing old segments
+    return time.time() - os.path.getmtime(path) > max_segment_age * 2
+
+
+def recover_segments(directory, max_segment_age=3600):
+    """Publish the complete events of .part files left behind by a crash"""
+    for name in os.listdir(directory):
+        if not name.endswith(SEGMENT_SUFFIX + PART_SUFFIX):
+            continue
+        part_path = os.path.join(directory, name)
+        try:
+            if not _writer_gone(name, part_path, max_segment_age):
+                continue
+
+            # The stream has no gzip trailer and may end mid-line, so keep
+            # every whole event read before the data runs out
+            lines = []
+            try:
+                with gzip.open(part_path, 'rb') as f:
+                    for line in f:
+                        if not line.endswith(b'\n'):
+                            break  # Cut off by the crash
+                        json.loads(line)
+                        lines.append(line)
+            except (OSError, EOFError, ValueError, zlib.error):
+                pass
+
+            if lines:
+                fd, temp_path = tempfile.mkstemp(dir=directory, prefix=name + '.', suffix='.tmp')
+                try:
+                    with os.fdopen(fd, 'wb') as raw, gzip.GzipFile(fileobj=raw, mode='wb') as f:
+                        f.writelines(lines)
+                    os.chmod(temp_path, 0o644)
+                    os.replace(temp_path, part_path[:-len(PART_SUFFIX)])
+                except BaseException:
+                    if os.path.exists(temp_path):
+                        os.remove(temp_path)
+                    raise
+            os.remove(part_path)
+        except OSError:
+            continue  # Another writer recovered it first, or it is locked
+
+
+class _DisabledWriter:
+    """Stand-in used when telemetry is turned off"""
+    dropped = 0
+
+    def record(self, game, event, session=None, **fields):
+        pass
+
+    def rotate(self, timeout=5.0):
+        pass
+
+    def close(self, timeout=5.0):
+        pass
+
+
+def telemetry_dir():
+    """Folder where segments and the rollup state are kept"""
+    return os.environ.get('GAMES_TELEMETRY_DIR', TELEMETRY_DIR)
+
+
+def get_telemetry():
+    """Return the process-wide telemetry writer, starting it on first use"""
+    global _writer
+    with _writer_lock:
+        if _writer is None:
+            if os.environ.get('GAMES_TELEMETRY', '').lower() in ('0', 'off', 'false', 'no'):
+                _writer = _DisabledWriter()
+            else:
+                try:
+                    _writer = TelemetryWriter(telemetry_dir())
+                    atexit.register(_writer.close)
+                except OSError:
+                    _writer = _DisabledWriter()  # Never stop a game over logging
+        return _writer
+
+
+def record(game, event, session=None, **fields):
+    """Record an event on the shared writer"""
+    get_telemetry().record(game, event, session, **fields)
+
+
+class MinuteAggregator:
+    def __init__(self, directory=None):
+        """Incremental per-minute rollup of the segments in directory"""
+        self.directory = directory or telemetry_dir()
+        self.state_path = os.path.join(self.directory, STATE_FILE)
+        self.processed = set()
+        self.damaged = set()  # Segments that can never be read, kept for inspection
+        # minutes["YYYY-MM-DD HH:MM"][game] -> {metric: value}
+        self.minutes = {}
+        self._load_state()
+
+    def _load_state(self):
+        """Load totals from the last run, if any"""
+        try:
+            with open(self.state_path, encoding='utf-8') as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return
+        self.processed = set(state.get('processed', []))
+        self.damaged = set(state.get('damaged', []))
+        self.minutes = state.get('minutes', {})
+
+    def _save_state(self):
+        """Save totals atomically so an interrupted update loses nothing"""
+        # A private temp file keeps two aggregators from writing into one file
+        fd, temp_path = tempfile.mkstemp(dir=self.directory, prefix=STATE_FILE + '.', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump({'processed': sorted(self.processed), 'damaged': sorted(self.damaged),
+                           'minutes': self.minutes}, f)
+            os.chmod(temp_path, 0o644)
+            os.replace(temp_path, self.state_path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+    def add_event(self, event, minutes=None):
+        """Fold one event into its minute's metrics (in self.minutes by default)"""
+        if minutes is None:
+            minutes = self.minutes
+        minute = time.strftime('%Y-%m-%d %H:%M', time.localtime(event['ts']))
+        metrics = minutes.setdefault(minute, {}).setdefault(event['game'], {})
+        metrics[event['event']] = metrics.get(event['event'], 0) + 1
+        if 'duration_seconds' in event:
+            metrics['duration_seconds'] = metrics.get('duration_seconds', 0) + event['duration_seconds']
+
+    def merge(self, minutes):
+        """Add per-minute metrics from another rollup into the totals"""
+        for minute, games in minutes.items():
+            for game, metrics in games.items():
+                totals = self.minutes.setdefault(minute, {}).setdefault(game, {})
+                for metric, value in metrics.items():
+                    totals[metric] = totals.get(metric, 0) + value
+
+    def update(self):
+        """Read segments closed since the last update; returns how many"""
+        if not os.path.isdir(self.directory):
+            return 0
+        new_segments = sorted(name for name in os.listdir(self.directory)
+                              if name.endswith(SEGMENT_SUFFIX)
+                              and name not in self.processed and name not in self.damaged)
+        for name in new_segments:
+            # Roll the segment up on its own first, so one that fails part
+            # way through adds nothing to the totals
+            segment_minutes = {}
+            try:
+                with gzip.open(os.path.join(self.directory, name), 'rt', encoding='utf-8') as f:
+                    for line in f:
+                        self.add_event(json.loads(line), segment_minutes)
+            except (gzip.BadGzipFile, zlib.error, EOFError, ValueError, KeyError, TypeError):
+                # Closed segments never change, so a bad one stays bad
+                self.damaged.add(name)
+                continue
+            except OSError:
+                continue  # Could not open it right now - try again next time
+            self.merge(segment_minutes)
+            self.processed.add(name)
+
+        if new_segments:
+            self._save_state()
+        return len(new_segments)
+
+    def totals(self, since=None):
+        """Sum metrics per game, optionally only for minutes >= since"""
+        totals = {}
+        for minute, games in self.minutes.items():
+            if since is not None and minute < since:
+                continue
+            for game, metrics in games.items():
+                game_totals = totals.setdefault(game, {})
+                for metric, value in metrics.items():
+                    game_totals[metric] = game_totals.get(metric, 0) + value
+        return totals